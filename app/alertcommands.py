@@ -4,7 +4,7 @@
 # terminal alert commands and registration
 
 from terminal.command import Command
-from strategy.strategy import Strategy
+from strategy.command.strategycommands import StrategyCommands
 
 from common.utils import timeframe_from_str, parse_datetime
 from strategy.alert.alert import Alert
@@ -123,7 +123,7 @@ class PriceCrossAlertCommand(Command):
         except Exception:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
             'market-id': market_id,
             'action': action,
             'alert': alert,
@@ -175,7 +175,7 @@ class RemoveAlertCommand(Command):
         except Exception:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
             'market-id': market_id,
             'action': action,
             'alert-id': alert_id
@@ -217,7 +217,7 @@ class AlertInfoCommand(Command):
             except Exception:
                 return False, "Invalid parameters"
 
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_INFO, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_INFO, {
                 'market-id': market_id,
                 'detail': 'alert',
                 'alert-id': alert_id
@@ -4,7 +4,7 @@
 # terminal region commands and registration
 
 from terminal.command import Command
-from strategy.strategy import Strategy
+from strategy.command.strategycommands import StrategyCommands
 
 from common.utils import timeframe_from_str, parse_datetime
 
@@ -76,7 +76,7 @@ class RangeRegionCommand(Command):
         except Exception:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
             'market-id': market_id,
             'action': action,
             'region': reg,
@@ -171,7 +171,7 @@ class TrendRegionCommand(Command):
         except Exception:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
             'market-id': market_id,
             'action': action,
             'region': reg,
@@ -224,7 +224,7 @@ class RemoveRegionCommand(Command):
         except Exception:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
             'market-id': market_id,
             'action': action,
             'region-id': region_id
@@ -266,7 +266,7 @@ class RegionInfoCommand(Command):
             except Exception:
                 return False, "Invalid parameters"
 
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_INFO, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_INFO, {
                 'market-id': market_id,
                 'detail': 'region',
                 'region-id': region_id
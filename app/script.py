@@ -11,6 +11,16 @@ import logging
 logger = logging.getLogger('siis.app.script')
 error_logger = logging.getLogger('siis.error.app.script')
 
+# names of the user scripts modules currently loaded, without the userscripts package prefix
+_loaded_scripts = set()
+
+
+def loaded_scripts():
+    """
+    Returns the sorted list of the names of the currently loaded user scripts.
+    """
+    return sorted(_loaded_scripts)
+
 
 def setup_script(action, module, watcher_service, trader_service, strategy_service, monitor_service, notifier_service):
     """
@@ -58,6 +68,8 @@ def setup_script(action, module, watcher_service, trader_service, strategy_servi
             results['error'] = True
             return results
 
+        _loaded_scripts.add(module)
+
         if hasattr(script_module, 'run_once'):
             # run once script
             run_once = getattr(script_module, 'run_once')
@@ -118,6 +130,8 @@ def setup_script(action, module, watcher_service, trader_service, strategy_servi
         script_module = None  # unref
         del sys.modules[module_name]
 
+        _loaded_scripts.discard(module)
+
         return results
 
     return results
@@ -0,0 +1,300 @@
+# @license Copyright (c) 2018 Dream Overflow
+# Manual trade arguments parsers, trade entry shared by long and short commands, trade assign,
+# and stop-loss or take-profit modification value.
+
+import re
+
+from common.utils import timeframe_from_str
+from instrument.instrument import Instrument
+
+# trade entry price arguments, per prefix :
+# (prefix length, payload key of the price, payload key of the mode or None to keep it, mode, error if not strictly
+# positive). A stop-loss or take-profit price does not reset a previously given percent or pip mode.
+TRADE_ENTRY_PRICE_ARGS = {
+    "L@": (2, 'limit-price', 'method', 'limit', None),
+    "L%": (2, 'limit-price', 'method', 'limit-percent', "Percent must be greater than 0"),
+    "L!": (2, 'limit-price', 'method', 'limit-pip', "Pip must be greater than 0"),
+    "T@": (2, 'trigger-price', 'method', 'trigger', None),
+    "SL@": (3, 'stop-loss', None, None, None),
+    "SL%": (3, 'stop-loss', 'stop-loss-price-mode', "percent", None),
+    "SL!": (3, 'stop-loss', 'stop-loss-price-mode', "pip", None),
+    "TP@": (3, 'take-profit', None, None, None),
+    "TP%": (3, 'take-profit', 'take-profit-price-mode', "percent", None),
+    "TP!": (3, 'take-profit', 'take-profit-price-mode', "pip", None),
+}
+
+# the prefixes are accepted either in upper or in lower case, not mixed
+TRADE_ENTRY_PRICE_ARGS.update({k.lower(): v for k, v in TRADE_ENTRY_PRICE_ARGS.items()})
+
+# first characters of the price arguments (limit, trigger, stop-loss and take-profit)
+PRICE_ARGS_FIRST_CHARS = frozenset("LlTtSs")
+
+# others trade entry arguments, per first character : (payload key, conversion of the value)
+TRADE_ENTRY_VALUE_ARGS = {
+    "'": ('timeframe', timeframe_from_str),
+    "*": ('quantity-rate', float),
+    "/": ('entry-timeout', timeframe_from_str),
+    "+": ('expiry', timeframe_from_str),
+    "x": ('leverage', float),
+    "-": ('context', str),
+    "q": ('user-quantity', float),
+}
+
+# the short entry does not take a user defined quantity
+SHORT_ENTRY_VALUE_ARGS = {k: v for k, v in TRADE_ENTRY_VALUE_ARGS.items() if k != "q"}
+
+# defaults values of the trade entry command payload, copied for each entry
+TRADE_ENTRY_TEMPLATE = {
+    'market-id': None,
+    'direction': 0,
+    'limit-price': None,
+    'trigger-price': None,
+    'method': 'market',
+    'quantity-rate': 1.0,
+    'user-quantity': 0.0,
+    'stop-loss': 0.0,
+    'take-profit': 0.0,
+    'stop-loss-price-mode': "price",
+    'take-profit-price-mode': "price",
+    'timeframe': Instrument.TF_4HOUR,
+    'entry-timeout': None,
+    'expiry': None,
+    'leverage': None,
+    'context': None
+}
+
+# the short entry payload has no user defined quantity
+SHORT_ENTRY_TEMPLATE = {k: v for k, v in TRADE_ENTRY_TEMPLATE.items() if k != 'user-quantity'}
+
+
+def parse_trade_entry(args, direction):
+    """
+    Parse the arguments of a manual trade entry command.
+
+    @param args list of str, first one is the market-id, others are optional prefixed values.
+    @param direction integer 1 for long or -1 for short, the short entry takes no user defined quantity.
+    @return A tuple(dict or None, None or str) The trade entry command payload, or an error message.
+
+    ie: ["BTCUSDT", "L@8500", "SL%5", "TP@9600"]
+    """
+    if not args:
+        return None, "Missing parameters"
+
+    if direction > 0:
+        params = TRADE_ENTRY_TEMPLATE.copy()
+        value_args = TRADE_ENTRY_VALUE_ARGS
+    else:
+        params = SHORT_ENTRY_TEMPLATE.copy()
+        value_args = SHORT_ENTRY_VALUE_ARGS
+
+    params['market-id'] = args[0]
+    params['direction'] = direction
+
+    # best+ is on the bid side for a long, best- on the ask side, the contrary for a short
+    plus_side, minus_side = ("Bid", "Ask") if direction > 0 else ("Ask", "Bid")
+
+    try:
+        for value in args[1:]:
+            if not value:
+                continue
+
+            c0 = value[0]
+
+            if c0 in PRICE_ARGS_FIRST_CHARS:
+                prefix = value[:2]
+                price_arg = TRADE_ENTRY_PRICE_ARGS.get(value[:3]) or TRADE_ENTRY_PRICE_ARGS.get(prefix)
+
+                if price_arg:
+                    offset, price_key, mode_key, mode, error = price_arg
+                    price = float(value[offset:])
+
+                    if error and price <= 0:
+                        return None, error
+
+                    params[price_key] = price
+                    if mode_key:
+                        params[mode_key] = mode
+                    continue
+
+                if prefix == "L+" or prefix == "l+":
+                    dist = int(value[2:])
+
+                    if dist < 1 or dist > 500:
+                        return None, "%s depth must be from 1 to 500" % plus_side
+
+                    params['method'] = 'best+%s' % dist
+                    continue
+
+                if prefix == "L-" or prefix == "l-":
+                    dist = int(value[2:])
+
+                    if dist < 1 or dist > 500:
+                        return None, "%s depth must be from 1 to 500" % minus_side
+
+                    params['method'] = 'best-%s' % dist
+                    continue
+
+            if value[-1] == "%" and c0 != "'" and c0 != "*":
+                params['quantity-rate'] = float(value[:-1]) * 0.01
+                continue
+
+            value_arg = value_args.get(c0)
+            if value_arg:
+                params[value_arg[0]] = value_arg[1](value[1:])
+
+    except ValueError:
+        return None, "Invalid parameters"
+
+    limit_price = params['limit-price']
+
+    if limit_price:
+        # stop-loss and take-profit in price mode must be on the right side of the limit price
+        stop_loss = params['stop-loss']
+        take_profit = params['take-profit']
+
+        if stop_loss and params['stop-loss-price-mode'] == "price":
+            if direction > 0 and stop_loss > limit_price:
+                return None, "Stop-loss must be lesser than limit price"
+            elif direction < 0 and stop_loss < limit_price:
+                return None, "Stop-loss must be greater than limit price"
+
+        if take_profit and params['take-profit-price-mode'] == "price":
+            if direction > 0 and take_profit < limit_price:
+                return None, "Take-profit must be greater than limit price"
+            elif direction < 0 and take_profit > limit_price:
+                return None, "Take-profit must be lesser than limit price"
+
+    if params['quantity-rate'] <= 0.0:
+        return None, "Quantity rate must be greater than zero" if direction > 0 else "Quantity must be non empty"
+
+    return params, None
+
+
+# trade assign literal arguments : (payload key, value)
+TRADE_ASSIGN_LITERAL_ARGS = {
+    "L": ('direction', 1),
+    "long": ('direction', 1),
+    "S": ('direction', -1),
+    "short": ('direction', -1),
+    "limit": ('order-type', "limit"),
+    "market": ('order-type', "market"),
+    "trigger": ('order-type', "trigger"),
+}
+
+# trade assign price arguments, per prefix : payload key
+TRADE_ASSIGN_PRICE_ARGS = {
+    "EP@": 'entry-price',
+    "SL@": 'stop-loss',
+    "TP@": 'take-profit',
+}
+
+# others trade assign arguments, per first character : (payload key, conversion of the value)
+TRADE_ASSIGN_VALUE_ARGS = {
+    "'": ('timeframe', timeframe_from_str),
+    "-": ('context', str),
+    # "/": ('entry-timeout', timeframe_from_str),
+    "+": ('expiry', timeframe_from_str),
+    "x": ('leverage', float),
+}
+
+# defaults values of the trade assign command payload, copied for each assignment
+TRADE_ASSIGN_TEMPLATE = {
+    'market-id': None,
+    'direction': 1,
+    'order-type': "limit",
+    'entry-price': None,
+    'quantity': 0.0,
+    'stop-loss': 0.0,
+    'take-profit': 0.0,
+    'timeframe': Instrument.TF_4HOUR,
+    'context': None,
+    # 'entry-timeout': None,
+    'expiry': None,
+    'leverage': None,
+}
+
+
+def parse_trade_assign(args):
+    """
+    Parse the arguments of a manual trade assign command, in a single pass, each argument being classified by
+    a literal lookup, then by its prefix, else it is the quantity.
+
+    @param args list of str, first one is the market-id, others are optional values, quantity without prefix.
+    @return A tuple(dict or None, None or str) The trade assign command payload, or an error message.
+
+    ie: ["BTCUSDT", "EP@8500", "SL@8300", "TP@9600", "0.521"]
+    """
+    if not args:
+        return None, "Missing parameters"
+
+    params = TRADE_ASSIGN_TEMPLATE.copy()
+    params['market-id'] = args[0]
+
+    try:
+        for value in args[1:]:
+            if not value:
+                continue
+
+            literal_arg = TRADE_ASSIGN_LITERAL_ARGS.get(value)
+            if literal_arg:
+                params[literal_arg[0]] = literal_arg[1]
+                continue
+
+            price_key = TRADE_ASSIGN_PRICE_ARGS.get(value[:3])
+            if price_key:
+                params[price_key] = float(value[3:])
+                continue
+
+            value_arg = TRADE_ASSIGN_VALUE_ARGS.get(value[0])
+            if value_arg:
+                params[value_arg[0]] = value_arg[1](value[1:])
+            else:
+                params['quantity'] = float(value)
+
+    except ValueError:
+        return None, "Invalid parameters"
+
+    return params, None
+
+
+# [EP|ep|M|m][+|-]<price>[%|pip|pips]
+TRADE_MODIFY_PRICE_RE = re.compile(r'^(EP|ep|M|m)?([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(%|pips?)?$')
+
+# modification method and value scale, per (prefix, suffix). The prefix is + for a signed value without EP or M.
+TRADE_MODIFY_PRICE_METHODS = {
+    ('', ''): ('price', 1.0),
+    ('+', ''): ('delta-price', 1.0),
+    ('+', '%'): ('delta-percent', 0.01),
+    ('+', 'pip'): ('delta-pip', 1.0),
+    ('EP', ''): ('entry-delta-price', 1.0),
+    ('EP', '%'): ('entry-delta-percent', 0.01),
+    ('EP', 'pip'): ('entry-delta-pip', 1.0),
+    ('M', ''): ('market-delta-price', 1.0),
+    ('M', '%'): ('market-delta-percent', 0.01),
+    ('M', 'pip'): ('market-delta-pip', 1.0),
+}
+
+
+def parse_trade_modify_price(value):
+    """
+    Parse the value of a stop-loss or take-profit modification.
+
+    @param value str ie: 1.10, +5%, -10pips, EP+0.5%, M-20pip.
+    @return A tuple(str, float) The modification method and its value.
+    @raise ValueError if the value is not valid.
+    """
+    match = TRADE_MODIFY_PRICE_RE.match(value)
+    if match is None:
+        raise ValueError("Invalid price value %s" % value)
+
+    prefix, number, suffix = match.groups()
+
+    prefix = prefix.upper() if prefix else ('+' if number[0] in '+-' else '')
+    suffix = suffix[:3] if suffix else ''
+
+    method = TRADE_MODIFY_PRICE_METHODS.get((prefix, suffix))
+    if method is None:
+        # absolute price with a suffix
+        raise ValueError("Invalid price value %s" % value)
+
+    return method[0], float(number) * method[1]
@@ -3,21 +3,91 @@
 # @license Copyright (c) 2018 Dream Overflow
 # terminal trading commands and registration
 
-import re
-import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from terminal.command import Command
-from strategy.strategy import Strategy
+from strategy.command.strategycommands import StrategyCommands
 from notifier.notifier import Notifier
-from trader.trader import Trader
+from trader.command.tradercommands import TraderCommands
 
-from common.utils import timeframe_from_str
-from instrument.instrument import Instrument
+from app.script import setup_script, loaded_scripts
+from app.tradeparser import parse_trade_entry, parse_trade_assign, parse_trade_modify_price
 
-from app.script import setup_script
+import logging
+logger = logging.getLogger('siis.app.tradingcommands')
+error_logger = logging.getLogger('siis.error.app.tradingcommands')
 
 
-class PlayCommand(Command):
+class StrategyOrNotifiersCompletion(object):
+    """
+    Completion of the [strategy|notifiers] <market-id|notifier-id> arguments, shared by the play, pause and info
+    commands. Must be the first base, before Command.
+    """
+
+    __slots__ = ()
+
+    def completion(self, args, tab_pos, direction):
+        if len(args) <= 1:
+            return self.iterate(0, ['strategy', 'notifiers'], args, tab_pos, direction)
+
+        elif len(args) <= 2:
+            if args[0] == "strategy":
+                # instrument, the strategy is only queried when the cached list is outdated
+                return self.iterate(1, self.cached_values('symbols', self.strategy_symbols_ids),
+                                    args, tab_pos, direction, ordered=True)
+
+            elif args[0] == "notifiers":
+                return self.iterate(1, self.cached_values(
+                    'notifiers', self._notifier_service.notifiers_identifiers), args, tab_pos, direction)
+
+        return args, 0
+
+    def strategy_symbols_ids(self):
+        strategy = self._strategy_service.strategy()
+        return strategy.symbols_ids() if strategy else []
+
+
+class StrategySymbolsCompletion(object):
+    """
+    Completion of the <market-id> first argument from the strategy symbols, shared by the trading commands.
+    Must be the first base, before Command.
+    """
+
+    __slots__ = ()
+
+    def completion(self, args, tab_pos, direction):
+        if len(args) <= 1:
+            strategy = self._strategy_service.strategy()
+            if strategy:
+                # the symbols are sorted, the matching ones are iterated by bisection
+                symbols = self.cached_values('symbols', strategy.symbols_ids, strategy)
+                return self.iterate(0, symbols, args, tab_pos, direction, ordered=True)
+
+        return args, 0
+
+
+class TraderSymbolsCompletion(object):
+    """
+    Completion of the <market-id> first argument from the trader symbols, shared by the trader commands.
+    Must be the first base, before Command.
+    """
+
+    __slots__ = ()
+
+    def completion(self, args, tab_pos, direction):
+        if len(args) <= 1:
+            trader = self._trader_service.trader()
+            if trader:
+                # the symbols are sorted, the matching ones are iterated by bisection
+                symbols = self.cached_values('symbols', trader.symbols_ids, trader)
+                return self.iterate(0, symbols, args, tab_pos, direction, ordered=True)
+
+        return args, 0
+
+
+class PlayCommand(StrategyOrNotifiersCompletion, Command):
+    __slots__ = '_strategy_service', '_notifier_service', '_dispatch'
+
     SUMMARY = "[strategy|notifiers] <empty,notifier-id> <market-id> to enable strategy-trader(s) or notifiers(s)."
     HELP = (
         "param1: [strategy|notifier]",
@@ -31,52 +101,52 @@ class PlayCommand(Command):
         self._strategy_service = strategy_service
         self._notifier_service = notifier_service
 
+        # handler per (target, number of arguments)
+        self._dispatch = {
+            ('strategy', 1): self.play_strategy,
+            ('strategy', 2): self.play_strategy_trader,
+            ('notifiers', 1): self.play_notifiers,
+            ('notifiers', 2): self.play_notifier,
+        }
+
     def execute(self, args):
-        if not args:
+        if len(args) < 1:
             return False, "Missing parameters"
 
-        if args[0] == 'strategy':
-            if len(args) == 1:
-                self._strategy_service.set_activity(True)
-                return True, "Activated any instruments for strategy"
+        if len(args) > 2:
+            return False, "Too many parameters"
 
-            elif len(args) == 2:
-                strategy = self._strategy_service.strategy()
-                if strategy:
-                    strategy.set_activity(True, args[1])
-                    return True, "Activated instrument %s" % args[1]
+        handler = self._dispatch.get((args[0], len(args)))
+        return handler(args) if handler else (False, None)
 
-        elif args[0] == 'notifiers':
-            if len(args) == 1:
-                self._notifier_service.set_activity(True)
-                return True, "Activated all notifiers"
+    def play_strategy(self, args):
+        self._strategy_service.set_activity(True)
+        return True, "Activated any instruments for strategy"
 
-            elif len(args) == 2:
-                notifier = self._notifier_service.notifier(args[1])
-                if notifier:
-                    notifier.set_activity(True)
-                    return True, "Activated notifier %s" % args[1]
+    def play_strategy_trader(self, args):
+        strategy = self._strategy_service.strategy()
+        if strategy:
+            strategy.set_activity(True, args[1])
+            return True, "Activated instrument %s" % args[1]
 
         return False, None
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            return self.iterate(0, ['strategy', 'notifiers'], args, tab_pos, direction)
+    def play_notifiers(self, args):
+        self._notifier_service.set_activity(True)
+        return True, "Activated all notifiers"
 
-        elif len(args) <= 2:
-            if args[0] == "strategy":
-                # instrument
-                strategy = self._strategy_service.strategy()
-                if strategy:
-                    return self.iterate(1, strategy.symbols_ids(), args, tab_pos, direction)
+    def play_notifier(self, args):
+        notifier = self._notifier_service.notifier(args[1])
+        if notifier:
+            notifier.set_activity(True)
+            return True, "Activated notifier %s" % args[1]
 
-            elif args[0] == "notifiers":
-                return self.iterate(1, self._notifier_service.notifiers_identifiers(), args, tab_pos, direction)
+        return False, None
 
-        return args, 0
 
+class PauseCommand(StrategyOrNotifiersCompletion, Command):
+    __slots__ = '_strategy_service', '_notifier_service', '_dispatch'
 
-class PauseCommand(Command):
     SUMMARY = "[strategy|notifiers] <notifier-id> <market-id> to disable strategy-trader(s) or notifiers(s)."
     HELP = (
         "param1: [strategy|notifier]",
@@ -90,52 +160,52 @@ class PauseCommand(Command):
         self._strategy_service = strategy_service
         self._notifier_service = notifier_service
 
+        # handler per (target, number of arguments)
+        self._dispatch = {
+            ('strategy', 1): self.pause_strategy,
+            ('strategy', 2): self.pause_strategy_trader,
+            ('notifiers', 1): self.pause_notifiers,
+            ('notifiers', 2): self.pause_notifier,
+        }
+
     def execute(self, args):
-        if not args:
+        if len(args) < 1:
             return False, "Missing parameters"
 
-        if args[0] == 'strategy':
-            if len(args) == 1:
-                self._strategy_service.set_activity(False)
-                return True, "Paused any instruments for strategy"
+        if len(args) > 2:
+            return False, "Too many parameters"
 
-            elif len(args) == 2:
-                strategy = self._strategy_service.strategy()
-                if strategy:
-                    strategy.set_activity(False, args[1])
-                    return True, "Paused instrument %s" % args[1]
+        handler = self._dispatch.get((args[0], len(args)))
+        return handler(args) if handler else (False, None)
 
-        elif args[0] == 'notifiers':
-            if len(args) == 1:
-                self._notifier_service.set_activity(False)
-                return True, "Paused all notifiers"
+    def pause_strategy(self, args):
+        self._strategy_service.set_activity(False)
+        return True, "Paused any instruments for strategy"
 
-            elif len(args) == 2:
-                notifier = self._notifier_service.notifier(args[1])
-                if notifier:
-                    notifier.set_activity(False)
-                    return True, "Paused notifier %s" % args[1]
+    def pause_strategy_trader(self, args):
+        strategy = self._strategy_service.strategy()
+        if strategy:
+            strategy.set_activity(False, args[1])
+            return True, "Paused instrument %s" % args[1]
 
         return False, None
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            return self.iterate(0, ['strategy', 'notifiers'], args, tab_pos, direction)
+    def pause_notifiers(self, args):
+        self._notifier_service.set_activity(False)
+        return True, "Paused all notifiers"
 
-        elif len(args) <= 2:
-            if args[0] == "strategy":
-                # instrument
-                strategy = self._strategy_service.strategy()
-                if strategy:
-                    return self.iterate(1, strategy.symbols_ids(), args, tab_pos, direction)
+    def pause_notifier(self, args):
+        notifier = self._notifier_service.notifier(args[1])
+        if notifier:
+            notifier.set_activity(False)
+            return True, "Paused notifier %s" % args[1]
 
-            elif args[0] == "notifiers":
-                return self.iterate(1, self._notifier_service.notifiers_identifiers(), args, tab_pos, direction)
+        return False, None
 
-        return args, 0
 
+class InfoCommand(StrategyOrNotifiersCompletion, Command):
+    __slots__ = '_strategy_service', '_notifier_service', '_dispatch'
 
-class InfoCommand(Command):
     SUMMARY = "[strategy|notifiers] <notifier-id> <market-id> to get info on strategy-trader(s), trader or notifier(s)."
     HELP = (
         "param1: [strategy|notifier]",
@@ -144,7 +214,8 @@ class InfoCommand(Command):
         "param4: <status|details> for strategy with a specified market-id only (optional)",
     )
 
-    DETAIL_CHOICES = ("status", "details")
+    DETAIL_CHOICES = ("status", "details")  # ordered for completion
+    DETAIL_SET = frozenset(DETAIL_CHOICES)   # for validation
 
     def __init__(self, strategy_service, notifier_service):
         super().__init__('info', None)
@@ -152,67 +223,65 @@ class InfoCommand(Command):
         self._strategy_service = strategy_service
         self._notifier_service = notifier_service
 
+        # handler per (target, number of arguments)
+        self._dispatch = {
+            ('strategy', 1): self.strategy_info,
+            ('strategy', 2): self.strategy_trader_info,
+            ('strategy', 3): self.strategy_trader_detail_info,
+            ('notifiers', 1): self.notifiers_info,
+            ('notifiers', 2): self.notifier_info,
+        }
+
     def execute(self, args):
-        if not args:
+        if len(args) < 1:
             return False, "Missing parameters. Need at at least strategy or notifiers."
 
-        detail = None
+        if len(args) > 3:
+            return False, "Too many parameters"
 
-        if len(args) == 3:
-            if args[2] in InfoCommand.DETAIL_CHOICES:
-                detail = args[2]
-            else:
-                return False, "Invalid detail option."
+        handler = self._dispatch.get((args[0], len(args)))
+        return handler(args) if handler else (False, None)
 
-        if args[0] == 'strategy':
-            if len(args) == 1:
-                results = self._strategy_service.command(Strategy.COMMAND_INFO, {})
-                return self.manage_results(results)
+    def strategy_info(self, args):
+        results = self._strategy_service.command(StrategyCommands.COMMAND_INFO, {})
+        return self.manage_results(results)
 
-            elif len(args) == 2:
-                results = self._strategy_service.command(Strategy.COMMAND_INFO, {'market-id': args[1]})
-                return self.manage_results(results)
+    def strategy_trader_info(self, args):
+        results = self._strategy_service.command(StrategyCommands.COMMAND_INFO, {'market-id': args[1]})
+        return self.manage_results(results)
 
-            elif len(args) == 3:
-                results = self._strategy_service.command(Strategy.COMMAND_TRADER_INFO, {
-                    'detail': detail,
-                    'market-id': args[1]
-                })
-                return self.manage_results(results)
+    def strategy_trader_detail_info(self, args):
+        # the detail option is only validated on its single path
+        if args[2] not in InfoCommand.DETAIL_SET:
+            return False, "Invalid detail option."
 
-        elif args[0] == 'notifiers':
-            if len(args) == 1:
-                results = self._notifier_service.command(Notifier.COMMAND_INFO, {})
-                return self.manage_results(results)
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_INFO, {
+            'detail': args[2],
+            'market-id': args[1]
+        })
+        return self.manage_results(results)
 
-            elif len(args) == 2:
-                results = self._notifier_service.command(Notifier.COMMAND_INFO, {'notifier': args[1]})
-                return self.manage_results(results)
+    def notifiers_info(self, args):
+        results = self._notifier_service.command(Notifier.COMMAND_INFO, {})
+        return self.manage_results(results)
 
-        return False, None
+    def notifier_info(self, args):
+        results = self._notifier_service.command(Notifier.COMMAND_INFO, {'notifier': args[1]})
+        return self.manage_results(results)
 
     def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            return self.iterate(0, ['strategy', 'notifiers'], args, tab_pos, direction)
-
-        elif len(args) <= 2:
-            if args[0] == "strategy":
-                # instrument
-                strategy = self._strategy_service.strategy()
-                if strategy:
-                    return self.iterate(1, strategy.symbols_ids(), args, tab_pos, direction)
-
-            elif args[0] == "notifiers":
-                return self.iterate(1, self._notifier_service.notifiers_identifiers(), args, tab_pos, direction)
-
-        elif len(args) <= 3:
+        if len(args) == 3:
             if args[0] == "strategy" and args[1]:
                 return self.iterate(2, InfoCommand.DETAIL_CHOICES, args, tab_pos, direction)
 
-        return args, 0
+            return args, 0
+
+        return super().completion(args, tab_pos, direction)
 
 
 class SetAffinityCommand(Command):
+    __slots__ = '_strategy_service',
+
     SUMMARY = "<market-id> [0..100] to modify the affinity per market."
     HELP = (
         "param1: <market-id> for specific (optional)",
@@ -229,36 +298,28 @@ class SetAffinityCommand(Command):
             return False, "Missing parameters. Need at least affinity."
 
         action = "set-affinity"
-        market_id = None
-
-        is_int = True
 
         try:
-            int(args[0])
+            # affinity only
+            affinity = int(args[0])
+            market_id = None
         except ValueError:
-            is_int = False
-
-        if is_int:
-            try:
-                affinity = int(args[0])
-            except ValueError:
-                return False, "Invalid affinity format"
-        else:
+            # market-id then affinity
             market_id = args[0]
 
             try:
                 affinity = int(args[1])
-            except ValueError:
+            except (ValueError, IndexError):
                 return False, "Invalid affinity format"
 
         if market_id:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
                 'market-id': market_id,
                 'action': action,
                 'affinity': affinity
             })
         else:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY_ALL, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY_ALL, {
                 'action': action,
                 'affinity': affinity
             })
@@ -268,25 +329,62 @@ class SetAffinityCommand(Command):
     def completion(self, args, tab_pos, direction):
         if len(args) <= 1:
             if len(args) == 1:
-                is_int = True
-
                 try:
+                    # affinity only, nothing to complete
                     int(args[0])
-                except ValueError:
-                    is_int = False
-
-                if is_int:
                     return args, 0
+                except ValueError:
+                    pass
 
             # instrument
             strategy = self._strategy_service.strategy()
             if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
+                # the symbols are sorted, the matching ones are iterated by bisection
+                symbols = self.cached_values('symbols', strategy.symbols_ids, strategy)
+                return self.iterate(0, symbols, args, tab_pos, direction, ordered=True)
 
         return args, 0
 
 
+# first characters a numeric value could start with (sign, digit, dot, inf, nan)
+NUMERIC_STARTS = frozenset('+-0123456789.iInN')
+
+
+def convert_option_value(v):
+    """
+    Convert an option value from string to int or float if possible, else keep it as string.
+    """
+    if v is None:
+        # undefined
+        return None
+
+    if not v:
+        # empty string
+        return ""
+
+    if v[0] not in NUMERIC_STARTS or '_' in v:
+        # string, cannot be a number, and the python digits separator is not accepted
+        return v
+
+    digits = v[1:] if v[0] in '+-' else v
+
+    if digits.isdigit() and digits.isascii():
+        # int
+        return int(v)
+
+    try:
+        # float ?
+        return float(v)
+    except ValueError:
+        pass
+
+    # string
+    return v
+
+
 class SetOptionCommand(Command):
+    __slots__ = '_strategy_service',
+
     SUMMARY = "any or specify <market-id> to modify the option per market."
     HELP = (
         "param1: <market-id> for specific (optional)",
@@ -294,10 +392,6 @@ class SetOptionCommand(Command):
         "param3: <value> Value of the parameter (integer, decimal or string)",
     )
 
-    # INTEGER_RE = re.compile(r'^[+-]{0,1}[0-9]+$')
-    INTEGER_RE = re.compile(r'^[+-]?[0-9]+$')
-    FLOAT_RE = re.compile(r'(?i)^\s*[+-]?(?:inf(inity)?|nan|(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*$')
-
     def __init__(self, strategy_service):
         super().__init__('set-option', 'SETOPT')
 
@@ -312,50 +406,24 @@ class SetOptionCommand(Command):
         option = None
         value = None
 
-        def convert_value(v):
-            if v is None:
-                # undefined
-                return None
-
-            if len(v) == 0:
-                # empty string
-                return ""
-
-            if SetOptionCommand.INTEGER_RE.match(v) is not None:
-                # int ?
-                try:
-                    return int(v)
-                except ValueError:
-                    return v
-
-            if SetOptionCommand.FLOAT_RE.match(v) is not None:
-                # float ?
-                try:
-                    return float(v)
-                except ValueError:
-                    return v
-
-            # string
-            return v
-
         if len(args) == 2:
             option = args[0]
-            value = convert_value(args[1])
+            value = convert_option_value(args[1])
 
         elif len(args) == 3:
             market_id = args[0]
             option = args[1]
-            value = convert_value(args[2])
+            value = convert_option_value(args[2])
 
         if market_id:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
                 'market-id': market_id,
                 'action': action,
                 'option': option,
                 'value': value
             })
         else:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY_ALL, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY_ALL, {
                 'action': action,
                 'option': option,
                 'value': value
@@ -368,12 +436,16 @@ class SetOptionCommand(Command):
             # instrument
             strategy = self._strategy_service.strategy()
             if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
+                # the symbols are sorted, the matching ones are iterated by bisection
+                symbols = self.cached_values('symbols', strategy.symbols_ids, strategy)
+                return self.iterate(0, symbols, args, tab_pos, direction, ordered=True)
 
         return args, 0
 
 
 class SetFrozenQuantityCommand(Command):
+    __slots__ = '_trader_service',
+
     SUMMARY = "<asset-name> to modify the frozen quantity per asset."
     HELP = (
         "param1: <asset-name> Asset name",
@@ -398,7 +470,7 @@ class SetFrozenQuantityCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._trader_service.command(Trader.COMMAND_TRADER_FROZE_ASSET_QUANTITY, {
+        results = self._trader_service.command(TraderCommands.COMMAND_TRADER_FROZE_ASSET_QUANTITY, {
             'asset': asset_name,
             'quantity': quantity,
             'action': action
@@ -416,7 +488,9 @@ class SetFrozenQuantityCommand(Command):
         return args, 0
 
 
-class LongCommand(Command):
+class LongCommand(StrategySymbolsCompletion, Command):
+    __slots__ = '_strategy_service',
+
     SUMMARY = "to manually create to a new trade in LONG direction"
     HELP = (
         "param1: <market-id>",
@@ -441,159 +515,19 @@ class LongCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
-            return False, "Missing parameters"
-
         # ie: ":long BTCUSDT L@8500 SL%5 TP@9600", direction base on command name
-        direction = 1
-        method = 'market'
-        limit_price = None
-        trigger_price = None
-        stop_loss = 0.0
-        take_profit = 0.0
-        stop_loss_price_mode = "price"
-        take_profit_price_mode = "price"
-        user_quantity = 0.0
-        quantity_rate = 1.0
-        timeframe = Instrument.TF_4HOUR
-        entry_timeout = None
-        expiry = None
-        leverage = None
-        context = None
-
-        if len(args) < 1:
-            return False, "Missing parameters"
-
-        try:
-            market_id = args[0]
-
-            for value in args[1:]:
-                if not value:
-                    continue
-
-                if value.startswith("L@") or value.startswith("l@"):
-                    method = 'limit'
-                    limit_price = float(value[2:])
-
-                elif value.startswith("L%") or value.startswith("l%"):
-                    method = 'limit-percent'
-                    limit_price = float(value[2:])
-
-                    if limit_price <= 0:
-                        return False, "Percent must be greater than 0"
-
-                elif value.startswith("L!") or value.startswith("l!"):
-                    method = 'limit-pip'
-                    limit_price = float(value[2:])
-
-                    if limit_price <= 0:
-                        return False, "Pip must be greater than 0"
-
-                elif value.startswith("L+") or value.startswith("l+"):
-                    dist = int(value[2:])
-
-                    if dist < 1 or dist > 500:
-                        return False, "Bid depth must be from 1 to 500"
-
-                    method = 'best+%s' % dist
-
-                elif value.startswith("L-") or value.startswith("l-"):
-                    dist = int(value[2:])
-
-                    if dist < 1 or dist > 500:
-                        return False, "Ask depth must be from 1 to 500"
-
-                    method = 'best-%s' % dist
-
-                elif value.startswith("T@") or value.startswith("t@"):
-                    method = 'trigger'
-                    trigger_price = float(value[2:])
-
-                elif value.startswith("SL@") or value.startswith("sl@"):
-                    stop_loss = float(value[3:])
-                elif value.startswith("SL%") or value.startswith("sl%"):
-                    stop_loss = float(value[3:])
-                    stop_loss_price_mode = "percent"
-                elif value.startswith("SL!") or value.startswith("sl!"):
-                    stop_loss = float(value[3:])
-                    stop_loss_price_mode = "pip"
-
-                elif value.startswith("TP@") or value.startswith("tp@"):
-                    take_profit = float(value[3:])
-                elif value.startswith("TP%") or value.startswith("tp%"):
-                    take_profit = float(value[3:])
-                    take_profit_price_mode = "percent"
-                elif value.startswith("TP!") or value.startswith("tp!"):
-                    take_profit = float(value[3:])
-                    take_profit_price_mode = "pip"
-
-                elif value.startswith("'"):
-                    timeframe = timeframe_from_str(value[1:])
+        params, error = parse_trade_entry(args, 1)
+        if error:
+            return False, error
 
-                elif value.startswith("*"):
-                    quantity_rate = float(value[1:])
-
-                elif value.endswith("%"):
-                    quantity_rate = float(value[:-1]) * 0.01
-
-                elif value.startswith("/"):
-                    entry_timeout = timeframe_from_str(value[1:])
-
-                elif value.startswith("+"):
-                    expiry = timeframe_from_str(value[1:])
-
-                elif value.startswith("x"):
-                    leverage = float(value[1:])
-
-                elif value.startswith("-"):
-                    context = value[1:]
-
-                elif value.startswith("q"):
-                    user_quantity = float(value[1:])
-
-        except ValueError:
-            return False, "Invalid parameters"
-
-        if limit_price and stop_loss and stop_loss_price_mode == "price" and stop_loss > limit_price:
-            return False, "Stop-loss must be lesser than limit price"
-
-        if limit_price and take_profit and take_profit_price_mode == "price" and take_profit < limit_price:
-            return False, "Take-profit must be greater than limit price"
-
-        if quantity_rate <= 0.0:
-            return False, "Quantity rate must be greater than zero"
-
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_ENTRY, {
-            'market-id': market_id,
-            'direction': direction,
-            'limit-price': limit_price,
-            'trigger-price': trigger_price,
-            'method': method,
-            'quantity-rate': quantity_rate,
-            'user-quantity': user_quantity,
-            'stop-loss': stop_loss,
-            'take-profit': take_profit,
-            'stop-loss-price-mode': stop_loss_price_mode,
-            'take-profit-price-mode': take_profit_price_mode,
-            'timeframe': timeframe,
-            'entry-timeout': entry_timeout,
-            'expiry': expiry,
-            'leverage': leverage,
-            'context': context
-        })
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_ENTRY, params)
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
 
-        return args, 0
+class ShortCommand(StrategySymbolsCompletion, Command):
+    __slots__ = '_strategy_service',
 
-
-class ShortCommand(Command):
     SUMMARY = "to manually create to a new trade in SHORT direction"
     HELP = (
         "param1: <market-id>",
@@ -617,154 +551,19 @@ class ShortCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
-            return False, "Missing parameters"
+        # ie: ":short BTCUSDT L@8500 SL@8700 TP@8000", direction base on command name
+        params, error = parse_trade_entry(args, -1)
+        if error:
+            return False, error
 
-        # ie: ":long BTCUSDT L@8500 SL@8300 TP@9600 1.0", direction base on command name
-        direction = -1
-        method = 'market'
-        limit_price = None
-        trigger_price = None
-        stop_loss = 0.0
-        take_profit = 0.0
-        stop_loss_price_mode = "price"
-        take_profit_price_mode = "price"
-        quantity_rate = 1.0
-        timeframe = Instrument.TF_4HOUR
-        entry_timeout = None
-        expiry = None
-        leverage = None
-        context = None
-
-        if len(args) < 1:
-            return False, "Missing parameters"
-
-        try:
-            market_id = args[0]
-
-            for value in args[1:]:
-                if not value:
-                    continue
-
-                if value.startswith("L@") or value.startswith("l@"):
-                    method = 'limit'
-                    limit_price = float(value[2:])
-
-                elif value.startswith("L%") or value.startswith("l%"):
-                    method = 'limit-percent'
-                    limit_price = float(value[2:])
-
-                    if limit_price <= 0:
-                        return False, "Percent must be greater than 0"
-
-                elif value.startswith("L!") or value.startswith("l!"):
-                    method = 'limit-pip'
-                    limit_price = float(value[2:])
-
-                    if limit_price <= 0:
-                        return False, "Pip must be greater than 0"
-
-                elif value.startswith("L+") or value.startswith("l+"):
-                    dist = int(value[2:])
-
-                    if dist < 1 or dist > 500:
-                        return False, "Ask depth must be from 1 to 500"
-
-                    method = 'best+%s' % dist
-
-                elif value.startswith("L-") or value.startswith("l-"):
-                    dist = int(value[2:])
-
-                    if dist < 1 or dist > 500:
-                        return False, "Bid depth must be from 1 to 500"
-
-                    method = 'best-%s' % dist
-
-                elif value.startswith("T@") or value.startswith("t@"):
-                    method = 'trigger'
-                    trigger_price = float(value[2:])
-
-                elif value.startswith("SL@") or value.startswith("sl@"):
-                    stop_loss = float(value[3:])
-                elif value.startswith("SL%") or value.startswith("sl%"):
-                    stop_loss = float(value[3:])
-                    stop_loss_price_mode = "percent"
-                elif value.startswith("SL!") or value.startswith("sl!"):
-                    stop_loss = float(value[3:])
-                    stop_loss_price_mode = "pip"
-
-                elif value.startswith("TP@") or value.startswith("tp@"):
-                    take_profit = float(value[3:])
-                elif value.startswith("TP%") or value.startswith("tp%"):
-                    take_profit = float(value[3:])
-                    take_profit_price_mode = "percent"
-                elif value.startswith("TP!") or value.startswith("tp!"):
-                    take_profit = float(value[3:])
-                    take_profit_price_mode = "pip"
-
-                elif value.startswith("'"):
-                    timeframe = timeframe_from_str(value[1:])
-
-                elif value.startswith("*"):
-                    quantity_rate = float(value[1:])
-
-                elif value.endswith("%"):
-                    quantity_rate = float(value[:-1]) * 0.01
-
-                elif value.startswith("/"):
-                    entry_timeout = timeframe_from_str(value[1:])
-
-                elif value.startswith("+"):
-                    expiry = timeframe_from_str(value[1:])
-
-                elif value.startswith("x"):
-                    leverage = float(value[1:])
-
-                elif value.startswith("-"):
-                    context = value[1:]
-
-        except ValueError:
-            return False, "Invalid parameters"
-
-        if limit_price and stop_loss and stop_loss_price_mode == "price" and stop_loss < limit_price:
-            return False, "Stop-loss must be greater than limit price"
-
-        if limit_price and take_profit and take_profit_price_mode == "price" and take_profit > limit_price:
-            return False, "Take-profit must be lesser than limit price"
-
-        if quantity_rate <= 0.0:
-            return False, "Quantity must be non empty"
-
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_ENTRY, {
-            'market-id': market_id,
-            'direction': direction,
-            'limit-price': limit_price,
-            'trigger-price': trigger_price,
-            'method': method,
-            'quantity-rate': quantity_rate,
-            'stop-loss': stop_loss,
-            'take-profit': take_profit,
-            'stop-loss-price-mode': stop_loss_price_mode,
-            'take-profit-price-mode': take_profit_price_mode,
-            'timeframe': timeframe,
-            'entry-timeout': entry_timeout,
-            'expiry': expiry,
-            'leverage': leverage,
-            'context': context
-        })
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_ENTRY, params)
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
 
+class CloseCommand(StrategySymbolsCompletion, Command):
+    __slots__ = '_strategy_service',
 
-class CloseCommand(Command):
     SUMMARY = "to manually close a managed trade at market or limit"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -777,15 +576,12 @@ class CloseCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) != 2:
             return False, "Missing parameters"
 
         action = "close"
 
         # ie ":close EURUSD 5"
-        if len(args) != 2:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
             trade_id = int(args[1])
@@ -793,7 +589,7 @@ class CloseCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_EXIT, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_EXIT, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action
@@ -801,16 +597,10 @@ class CloseCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
 
+class CleanCommand(StrategySymbolsCompletion, Command):
+    __slots__ = '_strategy_service',
 
-class CleanCommand(Command):
     SUMMARY = "to manually force to remove a managed trade and all its related orders without reducing its " \
               "remaining quantity"
     HELP = (
@@ -824,15 +614,12 @@ class CleanCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) != 2:
             return False, "Missing parameters"
 
         action = "clean"
 
         # ie ":clean XRPUSDT 5"
-        if len(args) != 2:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
             trade_id = int(args[1])
@@ -840,7 +627,7 @@ class CleanCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_CLEAN, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_CLEAN, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action
@@ -848,16 +635,8 @@ class CleanCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
-class StepStopLossOperationCommand(Command):
+class StepStopLossOperationCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to manually add a step-stop-loss operation on a trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -872,16 +651,13 @@ class StepStopLossOperationCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) != 4:
             return False, "Missing parameters"
 
         action = "add-op"
         op = "step-stop-loss"
 
         # ie ":SSL EURUSD 4 1.12 1.15"
-        if len(args) != 4:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
 
@@ -892,7 +668,7 @@ class StepStopLossOperationCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_MODIFY, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action,
@@ -903,16 +679,8 @@ class StepStopLossOperationCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
 
-
-class RemoveOperationCommand(Command):
+class RemoveOperationCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to manually remove an operation from a trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -926,15 +694,12 @@ class RemoveOperationCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) < 3:
             return False, "Missing parameters"
 
         action = 'del-op'
 
         # ie ":D EURUSD 1 5"
-        if len(args) < 3:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
 
@@ -943,7 +708,7 @@ class RemoveOperationCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_MODIFY, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action,
@@ -952,16 +717,8 @@ class RemoveOperationCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
 
-
-class CheckTradeCommand(Command):
+class CheckTradeCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to manually recheck a trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -975,15 +732,12 @@ class CheckTradeCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) < 2:
             return False, "Missing parameters"
 
         repair = False
 
         # ie ":CHKT EURUSD 4"
-        if len(args) < 2:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
 
@@ -994,7 +748,7 @@ class CheckTradeCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_CHECK, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_CHECK, {
             'market-id': market_id,
             'trade-id': trade_id,
             'repair': repair
@@ -1002,16 +756,8 @@ class CheckTradeCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
 
-        return args, 0
-
-
-class ModifyStopLossCommand(Command):
+class ModifyStopLossCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to manually modify the stop-loss of a trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -1027,78 +773,27 @@ class ModifyStopLossCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) < 3:
             return False, "Missing parameters"
 
         action = 'stop-loss'
-        method = 'price'
         force = False
 
         # ie ":SL EURUSD 1 1.10"
-        if len(args) < 3:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
             trade_id = int(args[1])
 
-            if args[2].startswith('+') or args[2].startswith('-'):
-                # last value relative delta price, % or pip(s)
-                if args[2].endswith('%'):
-                    method = 'delta-percent'
-                    stop_loss = float(args[2][:-1]) * 0.01
-                elif args[2].endswith('pip'):
-                    method = 'delta-pip'
-                    stop_loss = float(args[2][:-3])
-                elif args[2].endswith('pips'):
-                    method = 'delta-pip'
-                    stop_loss = float(args[2][:-4])
-                else:
-                    method = 'delta-price'
-                    stop_loss = float(args[2])
-
-            elif args[2].startswith("EP") or args[2].startswith("ep"):
-                # entry-price relative delta price, % or pip(s)
-                if args[2].endswith('%'):
-                    method = 'entry-delta-percent'
-                    stop_loss = float(args[2][2:-1]) * 0.01
-                elif args[2].endswith('pip'):
-                    method = 'entry-delta-pip'
-                    stop_loss = float(args[2][2:-3])
-                elif args[2].endswith('pips'):
-                    method = 'entry-delta-pip'
-                    stop_loss = float(args[2][2:-4])
-                else:
-                    method = 'entry-delta-price'
-                    stop_loss = float(args[2][2:])
-
-            elif args[2].startswith("M") or args[2].startswith("m"):
-                # market-price relative delta price, % or pip(s)
-                if args[2].endswith('%'):
-                    method = 'market-delta-percent'
-                    stop_loss = float(args[2][1:-1]) * 0.01
-                elif args[2].endswith('pip'):
-                    method = 'market-delta-pip'
-                    stop_loss = float(args[2][1:-1])
-                elif args[2].endswith('pips'):
-                    method = 'market-delta-pip'
-                    stop_loss = float(args[2][1:-1])
-                else:
-                    method = 'market-delta-price'
-                    stop_loss = float(args[2][1:])
-
-            else:
-                # absolute price
-                stop_loss = float(args[2])
+            method, stop_loss = parse_trade_modify_price(args[2])
 
             if len(args) > 3:
                 # create an order or modify the position, else use default
-                force = str(args[3]) == "force"
+                force = args[3] == "force"
 
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_MODIFY, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action,
@@ -1109,16 +804,8 @@ class ModifyStopLossCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
 
-        return args, 0
-
-
-class ModifyTakeProfitCommand(Command):
+class ModifyTakeProfitCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to manually modify the take-profit of a trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -1134,77 +821,27 @@ class ModifyTakeProfitCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) < 3:
             return False, "Missing parameters"
 
         action = 'take-profit'
-        method = 'price'
         force = False
 
         # ie ":TP EURUSD 1 1.15"
-        if len(args) < 3:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
             trade_id = int(args[1])
 
-            if args[2].startswith('+') or args[2].startswith('-'):
-                # last value relative delta price or %
-                if args[2].endswith('%'):
-                    method = 'delta-percent'
-                    take_profit = float(args[2][:-1]) * 0.01
-                elif args[2].endswith('pip'):
-                    method = 'delta-pip'
-                    take_profit = float(args[2][:-3])
-                elif args[2].endswith('pips'):
-                    method = 'delta-pip'
-                    take_profit = float(args[2][:-4])
-                else:
-                    method = 'delta-price'
-                    take_profit = float(args[2])
-
-            elif args[2].startswith("EP") or args[2].startswith("ep"):
-                # entry-price relative delta price or %
-                if args[2].endswith('%'):
-                    method = 'entry-delta-percent'
-                    take_profit = float(args[2][2:-1]) * 0.01
-                elif args[2].endswith('pip'):
-                    method = 'entry-delta-pip'
-                    take_profit = float(args[2][2:-3])
-                elif args[2].endswith('pips'):
-                    method = 'entry-delta-pip'
-                    take_profit = float(args[2][2:-4])
-                else:
-                    method = 'entry-delta-price'
-                    take_profit = float(args[2][2:])
-
-            elif args[2].startswith("M") or args[2].startswith("m"):
-                # market-price relative delta price or %
-                if args[2].endswith('%'):
-                    method = 'market-delta-percent'
-                    take_profit = float(args[2][1:-1]) * 0.01
-                elif args[2].endswith('pip'):
-                    method = 'market-delta-pip'
-                    take_profit = float(args[2][1:-1])
-                elif args[2].endswith('pips'):
-                    method = 'market-delta-pip'
-                    take_profit = float(args[2][1:-1])
-                else:
-                    method = 'market-delta-price'
-                    take_profit = float(args[2][1:])
-
-            else:
-                take_profit = float(args[2])
+            method, take_profit = parse_trade_modify_price(args[2])
 
             if len(args) > 3:
                 # create an order or modify the position, else use default
-                force = str(args[3]) == "force"
+                force = args[3] == "force"
 
         except ValueError:
             return False, "Invalid parameters"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_MODIFY, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action,
@@ -1215,16 +852,8 @@ class ModifyTakeProfitCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
-class TradeInfoCommand(Command):
+class TradeInfoCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to get operations info of a specific trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -1252,7 +881,7 @@ class TradeInfoCommand(Command):
             except ValueError:
                 return False, "Invalid parameters"
 
-            results = self._strategy_service.command(Strategy.COMMAND_TRADE_INFO, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_INFO, {
                 'market-id': market_id,
                 'trade-id': trade_id
             })
@@ -1261,16 +890,8 @@ class TradeInfoCommand(Command):
         else:
             return False, "Missing or invalid parameters"
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
-class AssignCommand(Command):
+class AssignCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to manually assign a quantity of asset or an existing position to a new trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -1292,65 +913,20 @@ class AssignCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
-            return False, "Missing parameters"
-
-        # ie: ":assign BTCUSDT EP@8500 SL@8300 TP@9600 0.521", direction base on command name
-        direction = 1
-        order_type = 'limit'
-        entry_price = None
-        stop_loss = 0.0
-        take_profit = 0.0
-        quantity = 0.0
-        timeframe = Instrument.TF_4HOUR
-        # entry_timeout = None
-        expiry = None
-        leverage = None
-        context = None
-
         if len(args) < 2:
             return False, "Missing parameters. Need at least entry price and quantity"
 
-        try:
-            market_id = args[0]
-
-            for value in args[1:]:
-                if not value:
-                    continue
-
-                if value == 'L' or value == 'long':
-                    direction = 1
-                elif value == 'S' or value == 'short':
-                    direction = -1
-                elif value == 'limit':
-                    order_type = value
-                elif value == 'market':
-                    order_type = value
-                elif value == 'trigger':
-                    order_type = value
-                elif value.startswith("EP@"):
-                    entry_price = float(value[3:])
-                elif value.startswith("SL@"):
-                    stop_loss = float(value[3:])
-                elif value.startswith("TP@"):
-                    take_profit = float(value[3:])
-                elif value.startswith("'"):
-                    timeframe = timeframe_from_str(value[1:])
-                elif value.startswith("-"):
-                    context = value[1:]
-                # elif value.startswith("/"):
-                #     entry_timeout = timeframe_from_str(value[1:])
-                elif value.startswith("+"):
-                    expiry = timeframe_from_str(value[1:])
-                elif value.startswith("x"):
-                    leverage = float(value[1:])
-                else:
-                    quantity = float(value)
+        # ie: ":assign BTCUSDT EP@8500 SL@8300 TP@9600 0.521", direction base on command name
+        params, error = parse_trade_assign(args)
+        if error:
+            return False, error
 
-        except ValueError:
-            return False, "Invalid parameters"
+        direction = params['direction']
+        entry_price = params['entry-price']
+        stop_loss = params['stop-loss']
+        take_profit = params['take-profit']
 
-        if entry_price <= 0.0:
+        if entry_price is None or entry_price <= 0.0:
             return False, "Entry price must be specified"
 
         if stop_loss:
@@ -1365,36 +941,15 @@ class AssignCommand(Command):
             elif direction < 0 and take_profit >= entry_price:
                 return False, "Take-profit must be lesser than entry price"
 
-        if quantity <= 0.0:
+        if params['quantity'] <= 0.0:
             return False, "Quantity must be specified"
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_ASSIGN, {
-            'market-id': market_id,
-            'direction': direction,
-            'order-type': order_type,
-            'entry-price': entry_price,
-            'quantity': quantity,
-            'stop-loss': stop_loss,
-            'take-profit': take_profit,
-            'timeframe': timeframe,
-            'context': context,
-            # 'entry-timeout': entry_timeout,
-            'expiry': expiry,
-            'leverage': leverage,
-        })
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_ASSIGN, params)
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
-class CommentCommand(Command):
+class CommentCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to set the comment of a trade"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -1408,15 +963,12 @@ class CommentCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
-        if not args:
+        if len(args) < 2:
             return False, "Missing parameters"
 
         action = 'comment'
 
         # ie ":CC EURUSD 1 do a partial TP before"
-        if len(args) < 2:
-            return False, "Missing parameters"
-
         try:
             market_id = args[0]
             trade_id = int(args[1])
@@ -1424,12 +976,15 @@ class CommentCommand(Command):
         except ValueError:
             return False, "Invalid parameters"
 
-        if len(args) > 2:
+        if len(args) > 3:
             comment = ' '.join(args[2:])
+        elif len(args) == 3:
+            # single word comment
+            comment = args[2]
         else:
             comment = ""
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_MODIFY, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_MODIFY, {
             'market-id': market_id,
             'trade-id': trade_id,
             'action': action,
@@ -1438,14 +993,6 @@ class CommentCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
 class UserSaveCommand(Command):
     SUMMARY = "to save user data now (strategy traders states, options, regions, trades)"
@@ -1456,13 +1003,16 @@ class UserSaveCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
+        strategy = self._strategy_service.strategy()
+        if not strategy:
+            return False, "No configured strategy"
+
         try:
-            self._strategy_service.strategy().save()
+            strategy.save()
         except Exception as e:
             return False, repr(e)
 
-        return True, "Successfully saved strategy data for %s - %s" % (
-            self._strategy_service.strategy().name, self._strategy_service.strategy().identifier)
+        return True, "Successfully saved strategy data for %s - %s" % (strategy.name, strategy.identifier)
 
 
 class UserLoadCommand(Command):
@@ -1474,17 +1024,20 @@ class UserLoadCommand(Command):
         self._strategy_service = strategy_service
 
     def execute(self, args):
+        strategy = self._strategy_service.strategy()
+        if not strategy:
+            return False, "No configured strategy"
+
         try:
-            if not self._strategy_service.strategy().load():
+            if not strategy.load():
                 return True, "Unable to load strategy user data for %s - %s (can be done once trader is loaded and " \
-                             "only once)" % (self._strategy_service.strategy().name,
-                                             self._strategy_service.strategy().identifier)
+                             "only once)" % (strategy.name, strategy.identifier)
 
         except Exception as e:
             return False, repr(e)
 
         return True, "Successfully loaded strategy user data for %s - %s (checking trades can take more time)" % (
-            self._strategy_service.strategy().name, self._strategy_service.strategy().identifier)
+            strategy.name, strategy.identifier)
 
 
 class UserExportCommand(Command):
@@ -1501,6 +1054,20 @@ class UserExportCommand(Command):
 
     CHOICES = ("active", "history", "closed", "alert", "region", "strategy", "trader", "csv", "json", "pending")
 
+    # per choice : (option, value)
+    OPTIONS = {
+        "active": ('dataset', "active"),
+        "history": ('dataset', "history"),
+        "closed": ('dataset', "history"),
+        "alert": ('dataset', "alert"),
+        "region": ('dataset', "region"),
+        "strategy": ('dataset', "strategy"),
+        "trader": ('dataset', "trader"),
+        "pending": ('pending', True),
+        "csv": ('export-format', "csv"),
+        "json": ('export-format', "json"),
+    }
+
     def __init__(self, strategy_service, trader_service):
         super().__init__('export', 'EX')
 
@@ -1512,10 +1079,13 @@ class UserExportCommand(Command):
             return False, "Missing parameters"
 
         # ie: ":export BTCUSDT active"
-        dataset = "history"
+        options = {
+            'dataset': "history",
+            'pending': False,
+            'export-format': "json",
+        }
+
         market_id = None
-        export_format = "json"
-        pending = False
         filename = None
 
         arg_offset = 0
@@ -1526,60 +1096,44 @@ class UserExportCommand(Command):
         if len(args) >= 1:
             # specific market
             strategy = self._strategy_service.strategy()
-            if self._strategy_service:
-                if args[0] in strategy.symbols_ids():
+            if strategy:
+                if strategy.has_symbol(args[0]):
                     market_id = args[0]
                     arg_offset += 1
 
-        for i, arg in enumerate(args[arg_offset:]):
-            if arg == "active":
-                dataset = "active"
-            elif arg == "history" or arg == "closed":
-                dataset = "history"
-            elif arg == "alert":
-                dataset = "alert"
-            elif arg == "region":
-                dataset = "region"
-            elif arg == "strategy":
-                dataset = "strategy"
-            elif arg == "trader":
-                dataset = "trader"
-
-            elif arg == "pending":
-                pending = True
-
-            elif arg == "csv":
-                export_format = "csv"
-            elif arg == "json":
-                export_format = "json"
-
-            elif i+arg_offset == len(args)-1 and arg.endswith(".csv"):
-                filename = arg
-            elif i+arg_offset == len(args)-1 and arg.endswith(".json"):
-                filename = arg
-
-            else:
+        last = len(args)
+
+        # only the last argument can be the filename
+        if last > arg_offset and args[-1].endswith((".csv", ".json")):
+            filename = args[-1]
+            last -= 1
+
+        for arg in args[arg_offset:last]:
+            option = UserExportCommand.OPTIONS.get(arg)
+            if not option:
                 return False, "Unsupported option %s" % arg
 
-        if dataset == "trader":
-            results = self._trader_service.command(Trader.COMMAND_EXPORT, {
-                'dataset': dataset,
-                'export-format': export_format,
+            options[option[0]] = option[1]
+
+        if options['dataset'] == "trader":
+            results = self._trader_service.command(TraderCommands.COMMAND_EXPORT, {
+                'dataset': options['dataset'],
+                'export-format': options['export-format'],
                 'filename': filename,
             })
         elif market_id:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_EXPORT, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_EXPORT, {
                 'market-id': market_id,
-                'dataset': dataset,
-                'pending': pending,
-                'export-format': export_format,
+                'dataset': options['dataset'],
+                'pending': options['pending'],
+                'export-format': options['export-format'],
                 'filename': filename,
             })
         else:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_EXPORT_ALL, {
-                'dataset': dataset,
-                'pending': pending,
-                'export-format': export_format,
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_EXPORT_ALL, {
+                'dataset': options['dataset'],
+                'pending': options['pending'],
+                'export-format': options['export-format'],
                 'filename': filename,
             })
 
@@ -1589,8 +1143,11 @@ class UserExportCommand(Command):
         if len(args) <= 1:
             strategy = self._strategy_service.strategy()
             if strategy:
-                return self.iterate(0, list(UserExportCommand.CHOICES) + strategy.symbols_ids(), args, tab_pos,
-                                    direction)
+                # options followed by the instruments, only rebuilt when the cached list is outdated
+                choices = self.cached_values('choices', lambda: list(UserExportCommand.CHOICES) +
+                                             strategy.symbols_ids(), strategy)
+
+                return self.iterate(0, choices, args, tab_pos, direction)
         elif len(args) > 1:
             return self.iterate(len(args) - 1, UserExportCommand.CHOICES, args, tab_pos, direction)
 
@@ -1608,6 +1165,16 @@ class UserImportCommand(Command):
 
     CHOICES = ("active", "history", "closed", "alert", "region", "strategy", "trader")
 
+    # per data-set : default filename
+    FILENAMES = {
+        "active": "siis_trades.json",
+        "history": "siis_history.json",
+        "alert": "siis_alerts.json",
+        "region": "siis_regions.json",
+        "strategy": "siis_strategy.json",
+        "trader": "siis_trader.json",
+    }
+
     def __init__(self, strategy_service, trader_service):
         super().__init__('import', 'IM')
 
@@ -1615,47 +1182,30 @@ class UserImportCommand(Command):
         self._trader_service = trader_service
 
     def execute(self, args):
-        # ie: ":import active siis_trades.json"
-        dataset = ""
-        filename = ""
-
         if len(args) > 2:
             return False, "Too many parameters"
 
-        if len(args) == 1:
-            dataset = args[0]
-
-        elif len(args) == 2:
-            dataset = args[0]
-            filename = args[1]
-
-        if not dataset or dataset not in UserImportCommand.CHOICES:
-            return False, "Data-set must be specified"
+        # ie: ":import active siis_trades.json"
+        dataset = args[0] if args else ""
+        filename = args[1] if len(args) > 1 else ""
 
         if dataset == "closed":
             dataset = "history"
 
+        default_filename = UserImportCommand.FILENAMES.get(dataset)
+        if not default_filename:
+            return False, "Data-set must be specified"
+
         if not filename:
-            if dataset == 'active':
-                filename = "siis_trades.json"
-            elif dataset == 'history':
-                filename = "siis_history.json"
-            elif dataset == 'alert':
-                filename = "siis_alerts.json"
-            elif dataset == 'region':
-                filename = "siis_regions.json"
-            elif dataset == 'strategy':
-                filename = "siis_strategy.json"
-            elif dataset == 'trader':
-                filename = "siis_trader.json"
+            filename = default_filename
 
         if dataset == "trader":
-            results = self._trader_service.command(Trader.COMMAND_IMPORT, {
+            results = self._trader_service.command(TraderCommands.COMMAND_IMPORT, {
                 'dataset': dataset,
                 'filename': filename,
             })
         else:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_IMPORT_ALL, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_IMPORT_ALL, {
                 'dataset': dataset,
                 'filename': filename,
             })
@@ -1685,29 +1235,21 @@ class SetQuantityCommand(Command):
         if not args:
             return False, "Missing parameters"
 
-        # ie: ":setquantity BTCUSDT 1000"
-        action = "set-quantity"
-        market_id = None
-
-        if len(args) < 1:
-            return False, "Missing parameters"
-
         if len(args) > 2:
             return False, "Too many parameters"
 
-        is_float = True
+        # ie: ":setquantity BTCUSDT 1000"
+        action = "set-quantity"
+        market_id = None
 
         try:
-            float(args[0])
+            # quantity only
+            quantity = float(args[0])
         except ValueError:
-            is_float = False
+            # market-id then quantity
+            if len(args) < 2:
+                return False, "Missing parameters"
 
-        if is_float:
-            try:
-                quantity = float(args[0])
-            except ValueError:
-                return False, "Invalid quantity format"
-        else:
             market_id = args[0]
 
             try:
@@ -1719,13 +1261,13 @@ class SetQuantityCommand(Command):
             return False, "Invalid quantity, must be greater than zero"
 
         if market_id:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY, {
                 'market-id': market_id,
                 'action': action,
                 'quantity': quantity
             })
         else:
-            results = self._strategy_service.command(Strategy.COMMAND_TRADER_MODIFY_ALL, {
+            results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_MODIFY_ALL, {
                 'action': action,
                 'quantity': quantity
             })
@@ -1735,24 +1277,23 @@ class SetQuantityCommand(Command):
     def completion(self, args, tab_pos, direction):
         if len(args) <= 1:
             if len(args) == 1:
-                is_float = True
-
                 try:
+                    # quantity only, nothing to complete
                     float(args[0])
-                except ValueError:
-                    is_float = False
-
-                if is_float:
                     return args, 0
+                except ValueError:
+                    pass
 
             strategy = self._strategy_service.strategy()
             if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
+                # the symbols are sorted, the matching ones are iterated by bisection
+                symbols = self.cached_values('symbols', strategy.symbols_ids, strategy)
+                return self.iterate(0, symbols, args, tab_pos, direction, ordered=True)
 
         return args, 0
 
 
-class CloseAllTradeCommand(Command):
+class CloseAllTradeCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to close any current positions and trades (on a specified market or any)"
     HELP = (
         "param1: <market-id> Market identifier (optional)",
@@ -1770,22 +1311,14 @@ class CloseAllTradeCommand(Command):
         if len(args) == 1:
             market_id = args[0]
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_EXIT_ALL, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_EXIT_ALL, {
             'market-id': market_id,
         })
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
-class CancelAllPendingTradeCommand(Command):
+class CancelAllPendingTradeCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to cancel any pending trades, having empty realized quantity (on a specified market or any)"
     HELP = (
         "param1: <market-id> Market identifier (optional)",
@@ -1803,22 +1336,14 @@ class CancelAllPendingTradeCommand(Command):
         if len(args) == 1:
             market_id = args[0]
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADE_CANCEL_ALL_PENDING, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADE_CANCEL_ALL_PENDING, {
             'market-id': market_id,
         })
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
 
-
-class SellAllAssetCommand(Command):
+class SellAllAssetCommand(TraderSymbolsCompletion, Command):
     SUMMARY = "to sell at market, immediately any quantity available of free assets (for a specified market or any)"
     HELP = (
         "param1: <market-id> Market identifier (optional)",
@@ -1836,20 +1361,12 @@ class SellAllAssetCommand(Command):
         if len(args) == 1:
             market_id = args[0]
 
-        results = self._trader_service.command(Trader.COMMAND_SELL_ALL_ASSET, {
+        results = self._trader_service.command(TraderCommands.COMMAND_SELL_ALL_ASSET, {
             'market-id': market_id,
         })
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            trader = self._trader_service.trader()
-            if trader:
-                return self.iterate(0, trader.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
 class CancelAllOrderCommand(Command):
     SUMMARY = "to cancel any orders, immediately (for a specified market or any)"
@@ -1859,6 +1376,27 @@ class CancelAllOrderCommand(Command):
 
     CHOICES = ("spot-entry", "spot-exit", "spot", "margin-entry", "margin-exit", "margin", "entry", "exit")
 
+    OPTION_SPOT_ENTRY = 1
+    OPTION_SPOT_EXIT = 2
+    OPTION_MARGIN_ENTRY = 4
+    OPTION_MARGIN_EXIT = 8
+
+    # per choice : the mask of the options it sets
+    OPTIONS = {
+        "spot-entry": OPTION_SPOT_ENTRY,
+        "spot-exit": OPTION_SPOT_EXIT,
+        "spot": OPTION_SPOT_ENTRY | OPTION_SPOT_EXIT,
+        "margin-entry": OPTION_MARGIN_ENTRY,
+        "margin-exit": OPTION_MARGIN_EXIT,
+        "margin": OPTION_MARGIN_ENTRY | OPTION_MARGIN_EXIT,
+        "entry": OPTION_SPOT_ENTRY | OPTION_MARGIN_ENTRY,
+        "exit": OPTION_SPOT_EXIT | OPTION_MARGIN_EXIT,
+    }
+
+    # per mask : the tuple of the options names, for any combination
+    OPTIONS_NAMES = tuple(tuple(name for bit, name in ((1, "spot-entry"), (2, "spot-exit"), (4, "margin-entry"),
+                                                       (8, "margin-exit")) if mask & bit) for mask in range(16))
+
     def __init__(self, trader_service):
         super().__init__('!rmallorder', '!RMALLORDER')
 
@@ -1867,43 +1405,27 @@ class CancelAllOrderCommand(Command):
     def execute(self, args):
         # ie: ":!rmallorder BTCUSDT"
         market_id = None
-        options = set()
+        options = 0
         arg_offset = 0
 
         if len(args) >= 1:
             # specific market
             trader = self._trader_service.trader()
             if trader:
-                if args[0] in trader.symbols_ids():
+                if trader.has_symbol(args[0]):
                     market_id = args[0]
                     arg_offset += 1
 
         for arg in args[arg_offset:]:
-            if arg not in CancelAllOrderCommand.CHOICES:
+            arg_options = CancelAllOrderCommand.OPTIONS.get(arg)
+            if not arg_options:
                 return False, "Unsupported option %s" % arg
 
-            if arg == "spot":
-                options.add("spot-entry")
-                options.add("spot-exit")
-
-            if arg == "margin":
-                options.add("margin-entry")
-                options.add("margin-exit")
-
-            if arg == "entry":
-                options.add("spot-entry")
-                options.add("margin-entry")
+            options |= arg_options
 
-            if arg == "exit":
-                options.add("spot-exit")
-                options.add("margin-exit")
-
-            else:
-                options.add(arg)
-
-        results = self._trader_service.command(Trader.COMMAND_CANCEL_ALL_ORDER, {
+        results = self._trader_service.command(TraderCommands.COMMAND_CANCEL_ALL_ORDER, {
             'market-id': market_id,
-            'options': tuple(options)
+            'options': CancelAllOrderCommand.OPTIONS_NAMES[options]
         })
 
         return self.manage_results(results)
@@ -1912,15 +1434,18 @@ class CancelAllOrderCommand(Command):
         if len(args) <= 1:
             trader = self._trader_service.trader()
             if trader:
-                return self.iterate(0, list(CancelAllOrderCommand.CHOICES) + trader.symbols_ids(), args, tab_pos,
-                                    direction)
+                # options followed by the instruments, only rebuilt when the cached list is outdated
+                choices = self.cached_values('choices', lambda: list(CancelAllOrderCommand.CHOICES) +
+                                             trader.symbols_ids(), trader)
+
+                return self.iterate(0, choices, args, tab_pos, direction)
         elif len(args) > 1:
             return self.iterate(len(args) - 1, CancelAllOrderCommand.CHOICES, args, tab_pos, direction)
 
         return args, 0
 
 
-class CancelOrderCommand(Command):
+class CancelOrderCommand(TraderSymbolsCompletion, Command):
     SUMMARY = "<market-id> <order-id> to cancel a specific order, immediately"
     HELP = (
         "param1: <market-id> Market identifier",
@@ -1940,21 +1465,15 @@ class CancelOrderCommand(Command):
         market_id = args[0]
         order_id = args[1]
 
-        results = self._trader_service.command(Trader.COMMAND_CANCEL_ORDER, {
+        results = self._trader_service.command(TraderCommands.COMMAND_CANCEL_ORDER, {
             'market-id': market_id,
             'order-id': order_id
         })
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            trader = self._trader_service.trader()
-            if trader:
-                return self.iterate(0, trader.symbols_ids(), args, tab_pos, direction)
-
 
-class TickerMemSetCommand(Command):
+class TickerMemSetCommand(TraderSymbolsCompletion, Command):
     SUMMARY = "<market-id> to reset the mark on market to last price or any markets"
     HELP = (
         "param1: <market-id> Market identifier, optional",
@@ -1968,11 +1487,11 @@ class TickerMemSetCommand(Command):
     def execute(self, args):
         # ie: ":memset BTCUSDT"
         if len(args) == 0:
-            results = self._trader_service.command(Trader.COMMAND_TICKER_MEMSET, {
+            results = self._trader_service.command(TraderCommands.COMMAND_TICKER_MEMSET, {
                 'market-id': None,
             })
         elif len(args) == 1:
-            results = self._trader_service.command(Trader.COMMAND_TICKER_MEMSET, {
+            results = self._trader_service.command(TraderCommands.COMMAND_TICKER_MEMSET, {
                 'market-id': args[0],
             })
         else:
@@ -1980,15 +1499,6 @@ class TickerMemSetCommand(Command):
 
         return self.manage_results(results)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            # market
-            trader = self._trader_service.trader()
-            if trader:
-                return self.iterate(0, trader.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
 class ClosePositionCommand(Command):
     SUMMARY = "<position-key> to close at market a specific position, immediately"
@@ -2009,7 +1519,7 @@ class ClosePositionCommand(Command):
 
         target = args[0]
 
-        results = self._trader_service.command(Trader.COMMAND_CLOSE_MARKET, {
+        results = self._trader_service.command(TraderCommands.COMMAND_CLOSE_MARKET, {
             'key': target
         })
 
@@ -2033,7 +1543,7 @@ class CloseAllPositionCommand(Command):
         if len(args) != 0:
             return False, "Invalid parameters"
 
-        results = self._trader_service.command(Trader.COMMAND_CLOSE_ALL_MARKET, {})
+        results = self._trader_service.command(TraderCommands.COMMAND_CLOSE_ALL_MARKET, {})
 
         return self.manage_results(results)
 
@@ -2044,19 +1554,47 @@ class CloseAllPositionCommand(Command):
 class ReconnectCommand(Command):
     SUMMARY = "to force to reconnect"
 
+    # the disconnections can wait for the network, they are done by a single background worker, created on demand
+    _executor = None
+
     def __init__(self, watcher_service):
         super().__init__('reconnect', 'RECON')
 
         self._watcher_service = watcher_service
 
+    @classmethod
+    def executor(cls):
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reconnect")
+
+        return cls._executor
+
+    @classmethod
+    def shutdown_executor(cls):
+        """
+        Stop accepting reconnections and release the worker once done, without waiting for it.
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+            cls._executor = None
+
+    @staticmethod
+    def reconnect_done(future):
+        if not future.cancelled() and future.exception() is not None:
+            error_logger.error(repr(future.exception()))
+
     def execute(self, args):
         # will force to try to reconnect
         if len(args) == 1:
-            self._watcher_service.reconnect(args[0])
-            return True, "Force reconnect for watcher %s" % args[0]
+            future = ReconnectCommand.executor().submit(self._watcher_service.reconnect, args[0])
+            future.add_done_callback(ReconnectCommand.reconnect_done)
+
+            return True, "Force reconnect scheduled for watcher %s" % args[0]
 
-        self._watcher_service.reconnect()
-        return True, "Force reconnect for any watchers"
+        future = ReconnectCommand.executor().submit(self._watcher_service.reconnect)
+        future.add_done_callback(ReconnectCommand.reconnect_done)
+
+        return True, "Force reconnect scheduled for any watchers"
 
     def completion(self, args, tab_pos, direction):
         if len(args) <= 1:
@@ -2066,7 +1604,7 @@ class ReconnectCommand(Command):
         return args, 0
 
 
-class RecheckCommand(Command):
+class RecheckCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to force to recheck any trades"
 
     def __init__(self, strategy_service):
@@ -2080,24 +1618,16 @@ class RecheckCommand(Command):
             return False, "Invalid parameters"
 
         if len(args) == 1:
-            self._strategy_service.command(Strategy.COMMAND_TRADER_RECHECK, {
+            self._strategy_service.command(StrategyCommands.COMMAND_TRADER_RECHECK, {
                 'market-id': args[0]
             })
 
             return True, "Force to recheck any trades for %s" % args[0]
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_RECHECK_ALL, {})
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_RECHECK_ALL, {})
 
         return self.manage_results(results, "Force to recheck any trades for any markets")
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
 class SetReinvestGainCommand(Command):
     SUMMARY = "to enable, disable or configure the reinvest gain manager"
@@ -2109,6 +1639,8 @@ class SetReinvestGainCommand(Command):
         "param5: <initial-total-qty> initial total quantity (optional)",
     )
 
+    CHOICES = ("on", "off")
+
     def __init__(self, strategy_service):
         super().__init__('set-reinvest-gain', 'SRG')
 
@@ -2121,15 +1653,18 @@ class SetReinvestGainCommand(Command):
         if len(args) > 5:
             return False, "Too many parameters"
 
-        if args[0] not in ('on', 'off'):
+        if args[0] not in SetReinvestGainCommand.CHOICES:
             return False, "First parameter must be 'on' or 'off'"
 
         action = 'reinvest-gain' if args[0] == 'on' else 'normal'
-        context = args[1]
+        context = args[1] if len(args) > 1 else None
         trade_quantity = 0.0
         initial_total_qty = None
         step = 0.0
 
+        if not context:
+            return False, "Context must be specified"
+
         if action == 'reinvest-gain':
             if len(args) < 4:
                 return False, "Missing parameters"
@@ -2151,19 +1686,15 @@ class SetReinvestGainCommand(Command):
                 return False, "Step value must be greater than zero"
 
             if len(args) > 4:
-                initial_total_qty = float(args[4])
+                try:
+                    initial_total_qty = float(args[4])
+                except ValueError:
+                    return False, "Initial total quantity value must be decimal"
 
                 if initial_total_qty < 0:
                     return False, "Initial total quantity must be greater than zero"
 
-        elif action == 'normal':
-            if len(args) == 2:
-                context = args[1]
-
-        if not context:
-            return False, "Context must be specified"
-
-        results = self._strategy_service.command(Strategy.COMMAND_QUANTITY_GLOBAL_SHARE, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_QUANTITY_GLOBAL_SHARE, {
             'action': action,
             'context': context,
             'trade-quantity': trade_quantity,
@@ -2177,7 +1708,7 @@ class SetReinvestGainCommand(Command):
 
     def completion(self, args, tab_pos, direction):
         if len(args) <= 1:
-            return self.iterate(0, ('on', 'off'), args, tab_pos, direction)
+            return self.iterate(0, SetReinvestGainCommand.CHOICES, args, tab_pos, direction)
 
         return args, 0
 
@@ -2189,6 +1720,8 @@ class ScriptCommand(Command):
         "param2: <module> python module to execute or to remove",
     )
 
+    CHOICES = ("exec", "remove", "unload")
+
     def __init__(self, watcher_service, trader_service, strategy_service, monitor_service, notifier_service):
         super().__init__('!script', '!SC')
 
@@ -2205,7 +1738,7 @@ class ScriptCommand(Command):
         if len(args) > 2:
             return False, "Too many parameters"
 
-        if args[0] not in ('exec', 'remove', 'unload'):
+        if args[0] not in ScriptCommand.CHOICES:
             return False, "First parameter must be 'exec', 'remove' or 'unload'"
 
         action = args[0]
@@ -2222,21 +1755,15 @@ class ScriptCommand(Command):
 
     def completion(self, args, tab_pos, direction):
         if len(args) <= 1:
-            return self.iterate(0, ('exec', 'remove', 'unload'), args, tab_pos, direction)
+            return self.iterate(0, ScriptCommand.CHOICES, args, tab_pos, direction)
 
         if len(args) <= 2 and args[0] in ('remove', 'unload'):
-            modules = []
-
-            for module in sys.modules.keys():
-                if module.startswith('userscripts.'):
-                    modules.append(module.split('.')[-1])
-
-            return self.iterate(1, modules, args, tab_pos, direction)
+            return self.iterate(1, loaded_scripts(), args, tab_pos, direction, ordered=True)
 
         return args, 0
 
 
-class RestartCommand(Command):
+class RestartCommand(StrategySymbolsCompletion, Command):
     SUMMARY = "to force to restart an instrument of the strategy"
 
     def __init__(self, strategy_service):
@@ -2254,20 +1781,12 @@ class RestartCommand(Command):
 
         market_id = args[0]
 
-        results = self._strategy_service.command(Strategy.COMMAND_TRADER_RESTART, {
+        results = self._strategy_service.command(StrategyCommands.COMMAND_TRADER_RESTART, {
             'market-id': market_id,
         })
 
         return self.manage_results(results, "Force restart for strategy on instrument %s" % args[0])
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            strategy = self._strategy_service.strategy()
-            if strategy:
-                return self.iterate(0, strategy.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
 class SetTraderBalance(Command):
     SUMMARY = "Reset the trader balance in paper-mode only to a specific value."
@@ -2284,10 +1803,11 @@ class SetTraderBalance(Command):
         if not args:
             return False, "Missing parameters"
 
-        if not self._trader_service.trader():
+        trader = self._trader_service.trader()
+        if not trader:
             return False, "No configured trader"
 
-        if not self._trader_service.trader().paper_mode:
+        if not trader.paper_mode:
             return False, "Available only in paper-mode"
 
         if len(args) != 1:
@@ -2301,7 +1821,7 @@ class SetTraderBalance(Command):
         if balance <= 0.0:
             return False, "Invalid balance value, must be greater than zero"
 
-        self._trader_service.trader().account.set_balance(balance)
+        trader.account.set_balance(balance)
 
         return True, "Balance value updated"
 
@@ -2309,7 +1829,7 @@ class SetTraderBalance(Command):
         return args, 0
 
 
-class SetTraderMarketLeverage(Command):
+class SetTraderMarketLeverage(TraderSymbolsCompletion, Command):
     SUMMARY = "Set the leverage for a specific market if available."
     HELP = (
         "param1: <market-id> market identifier, symbol or alias",
@@ -2325,11 +1845,12 @@ class SetTraderMarketLeverage(Command):
         if not args:
             return False, "Missing parameters"
 
-        if not self._trader_service.trader():
+        trader = self._trader_service.trader()
+        if not trader:
             return False, "No configured trader !"
 
-        if (not self._trader_service.trader().account.account_type & self._trader_service.trader().account.TYPE_MARGIN
-                == self._trader_service.trader().account.TYPE_MARGIN):
+        account = trader.account
+        if account.account_type & account.TYPE_MARGIN != account.TYPE_MARGIN:
             return False, "Available only in margin trading !"
 
         if len(args) != 2:
@@ -2345,7 +1866,7 @@ class SetTraderMarketLeverage(Command):
         if not 1.0 <= leverage <= 500:
             return False, "Invalid leverage value (must be between 1 to 500)"
 
-        market = self._trader_service.trader().market(market_id)
+        market = trader.market(market_id)
         if not market:
             return False, "Invalid market identifier or alias"
 
@@ -2359,15 +1880,6 @@ class SetTraderMarketLeverage(Command):
 
         return True, "Market leverage updated %s to for %s" % (leverage, market_id)
 
-    def completion(self, args, tab_pos, direction):
-        if len(args) <= 1:
-            # market
-            trader = self._trader_service.trader()
-            if trader:
-                return self.iterate(0, trader.symbols_ids(), args, tab_pos, direction)
-
-        return args, 0
-
 
 def register_trading_commands(commands_handler, watcher_service, trader_service, strategy_service,
                               monitor_service, notifier_service):
@@ -12,6 +12,8 @@ class Connector(object):
     ByBit adapter to REST and WS API.
     """
 
+    __slots__ = '_protocol', '_host', '_base_url', '_account_id', '__api_key', '__api_secret', '_session', '_ws'
+
     def __init__(self, service, account_id, api_key, api_secret, host="bybit.com", callback=None):
         self._protocol = "https://"
         self._host = host or "bybit.com"
@@ -7,7 +7,6 @@ import hmac
 import time
 
 from connector.ftx.rest.client import FtxClient
-from connector.ftx.ws import WssClient
 
 import logging
 logger = logging.getLogger('siis.connector.ftx')
@@ -18,6 +17,11 @@ class Connector(object):
     FTX adapter to REST and WS API.
     """
 
+    __slots__ = '_protocol', '_host', '_base_url', '_account_id', '__api_key', '__api_secret', '_session', '_ws'
+
+    # timeframes in seconds supported by the candles resolution
+    TIMEFRAMES = frozenset((15, 60, 300, 900, 3600, 14400, 86400, 259200, 604800, 2592000))
+
     def __init__(self, service, account_id, api_key, api_secret, host="ftx.com", callback=None):
         self._protocol = "https://"
         self._host = host or "ftx.com"
@@ -38,6 +42,9 @@ class Connector(object):
             self._session = FtxClient(self.__api_key, self.__api_secret, None)
 
         if self._ws is None and use_ws:
+            # imported only if used, the fetchers does not need the twisted and autobahn WS stack
+            from connector.ftx.ws import WssClient
+
             self._ws = WssClient(self.__api_key, self.__api_secret)
 
     def disconnect(self):
@@ -218,4 +218,5 @@ class NotifierService(Service):
         return self._notifiers_insts.get(name)
 
     def notifiers_identifiers(self) -> List[str]:
-        return [notifier.identifier for k, notifier in self._notifiers_insts.items()]
+        # instances are indexed by their identifier
+        return list(self._notifiers_insts.keys())
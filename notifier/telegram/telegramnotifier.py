@@ -483,7 +483,7 @@ class TelegramNotifier(Notifier):
             # invalid parameters
             return False
 
-        if symbol not in self.service.strategy_service.strategy().symbols_ids():
+        if not self.service.strategy_service.strategy().has_symbol(symbol):
             # not managed symbol
             return True
 
@@ -4,7 +4,9 @@ from Cython.Build import cythonize
 from Cython.Distutils import build_ext
  
 extensions = [
-    Extension("siis", ["siis.py"])
+    Extension("siis", ["siis.py"]),
+    # trade entry parser, the pure python module is used when not built
+    Extension("app.tradeparser", ["app/tradeparser.py"])
 ]
  
 setup(
@@ -12,36 +12,204 @@ import time
 import logging
 import traceback
 
+from importlib import import_module
+
 from datetime import datetime
 
 from common.utils import parse_utc_datetime, fix_thread_set_name
 
-from watcher.service import WatcherService
-
-from notifier.notifier import Notifier
-from trader.service import TraderService
-from strategy.service import StrategyService
-from monitor.service import MonitorService
-from notifier.service import NotifierService
-from common.watchdog import WatchdogService
-from tools.tool import Tool
-
 from terminal.terminal import Terminal
-from terminal.command import CommandsHandler
-
-from database.database import Database
 
 from common.siislog import SiisLog
 
-from view.service import ViewService
-from view.defaultviews import setup_default_views
-
 from app.help import display_cli_help, display_welcome
 from app.setup import install
-from app.generalcommands import register_general_commands
-from app.tradingcommands import register_trading_commands
-from app.regioncommands import register_region_commands
-from app.alertcommands import register_alert_commands
+
+
+# command line flags : options to set
+FLAG_SETTERS = {
+    # livemode but in paper-mode
+    '--paper-mode': {'paper-mode': True},
+    # verbose display for tools
+    '--verbose': {'verbose': True},
+    # load trader and trade user data at startup
+    '--load': {'load': True},
+
+    # use the fetcher, binarizer, optimizer, syncer, rebuilder, exporter, importer, cleaner, statistics or history tool
+    '--fetch': {'tool': "fetcher"},
+    '--binarize': {'tool': "binarizer"},
+    '--optimize': {'tool': "optimizer"},
+    '--sync': {'tool': "syncer"},
+    '--rebuild': {'tool': "rebuilder"},
+    '--export': {'tool': "exporter"},
+    '--import': {'tool': "importer"},
+    '--clean': {'tool': "cleaner"},
+    '--statistics': {'tool': "statistics"},
+    '--history': {'tool': "history"},
+
+    '--no-conf': {'no-conf': True},
+    '--zip': {'zip': True},
+    '--update': {'update': True},
+
+    # startup the monitor service
+    '--monitor': {'monitor': True},
+
+    # fetcher option
+    '--install-market': {'install-market': True},
+    # do the initial OHLC fetch for watchers (syncer, watcher), default False
+    '--initial-fetch': {'initial-fetch': True},
+    '--prefetch': {'initial-fetch': True},
+    # store trade/quote/tick during watcher process (watcher), default False
+    '--store-trade': {'store-trade': True},
+    # store OHLCs during watcher process (watcher), default False
+    '--store-ohlc': {'store-ohlc': True},
+    '--store-candle': {'store-ohlc': True},
+
+    # backtest mean always paper-mode
+    '--backtest': {'paper-mode': True, 'backtesting': True},
+
+    # preprocess the indicators for the next backtest or live running
+    '--preprocess': {'preprocess': True},
+
+    # feed only with live data, does not run the trader and strategy services
+    '--watcher-only': {'watcher-only': True},
+}
+
+
+def positive_int(value):
+    value = int(value)
+    return value if value > 0 else None
+
+
+# command line --name=value options, per name :
+# (option key, conversion of the value, error if the converted value is empty)
+PREFIX_SETTERS = {
+    # use a named tool
+    '--tool': ('tool', str, None),
+
+    # override monitor HTTP port (+1 for WS port)
+    '--monitor-port': ('monitor-port', int, None),
+
+    # backtesting timestep, default is 60 second
+    '--timestep': ('timestep', float, None),
+    # backtesting time-factor
+    '--time-factor': ('time-factor', float, None),
+
+    # used with import or export
+    '--filename': ('filename', str, None),
+
+    # if backtest from and to date and tools
+    '--from': ('from', parse_utc_datetime, "Invalid 'from' datetime format"),
+    '--to': ('to', parse_utc_datetime, "Invalid 'to' datetime format"),
+    # fetch the last n data history
+    '--last': ('last', positive_int, "Invalid 'last' value. Must be at least 1"),
+
+    # fetch, binarize, optimize the data history for this market
+    '--market': ('market', str, None),
+    # fetcher data history option
+    '--spec': ('option', str, None),
+    # fetcher data history fetching delay between two calls
+    '--delay': ('delay', float, None),
+    # broker name for fetcher, watcher, optimize, binarize
+    '--broker': ('broker', str, None),
+    # fetch, binarize, optimize base timeframe
+    '--timeframe': ('timeframe', str, None),
+    # fetch cascaded ohlc generation
+    '--cascaded': ('cascaded', str, None),
+    # target ohlc generation
+    '--target': ('target', str, None),
+
+    # profile name
+    '--profile': ('profile', str, None),
+}
+
+
+# legacy tools, not yet as Tool model, from the tools.<name> module do_<name> function : options required by the tool
+LEGACY_TOOLS = {
+    'binarizer': ('market', 'from', 'to', 'broker'),
+    'fetcher': ('market', 'broker'),
+    'optimizer': ('market', 'from', 'broker'),
+    'rebuilder': ('market', 'from', 'broker', 'timeframe'),
+    'exporter': ('market', 'from', 'broker', 'filename'),
+    'importer': ('filename',),
+}
+
+
+# services listeners added once the trader service is started : (producer, listener) services names
+LISTENERS_ON_TRADER_START = (
+    # want to display desktop notification and update views
+    ('watcher', 'view'),
+    ('trader', 'view'),
+    # trader service listen to watcher service and update views
+    ('watcher', 'trader'),
+)
+
+# services listeners added once the strategy service is started : (producer, listener) services names
+LISTENERS_ON_STRATEGY_START = (
+    # want to be notifier of system errors
+    ('watchdog', 'notifier'),
+    # strategy service listen to watcher service
+    ('watcher', 'strategy'),
+    # want to display watchdog notification, strategy service listen to trader service
+    ('trader', 'notifier'),
+    ('trader', 'strategy'),
+    # want to display desktop notification, update view and notify on discord
+    ('strategy', 'notifier'),
+    ('strategy', 'view'),
+)
+
+
+# single key accelerators displaying a view : view identifier
+VIEW_KEYS = {
+    'A': 'account',
+    'B': 'activealert',
+    'D': 'debug',
+    'F': 'strategy',
+    'I': 'content',
+    'M': 'market',
+    'N': 'signal',
+    'O': 'order',
+    'P': 'perf',
+    'Q': 'asset',
+    'R': 'region',
+    'S': 'stats',
+    'T': 'ticker',
+    'W': 'alert',
+    'X': 'position',
+    'Z': 'traderstate',
+}
+
+# single key accelerators toggling an option of the views : view service method
+VIEW_TOGGLE_KEYS = {
+    '*': 'toggle_opt1',
+    '$': 'toggle_opt2',
+    '%': 'toggle_percent',
+    '=': 'toggle_table',
+    ',': 'toggle_group',
+    ';': 'toggle_order',
+    '!': 'toggle_datetime_format',
+}
+
+
+# single key accelerators toggling an option of the desktop notifier : toggle command data, read only
+NOTIFIER_TOGGLE_KEYS = {
+    'a': {'notifier': "desktop", 'value': "audible"},
+    'n': {'notifier': "desktop", 'value': "popup"},
+}
+
+
+def command_args(value):
+    """
+    Split a typed command value into its arguments.
+
+    @param value str or None The typed value, the arguments are those of a command (starting with ':').
+    @return list of str The arguments, with a last empty one when the value ends with a space.
+    """
+    args = [arg for arg in value[1:].split(' ') if arg] if value and value[0] == ':' else []
+    if value and value[-1] == ' ':
+        args.append('')
+
+    return args
 
 
 def signal_handler(sig, frame):
@@ -49,33 +217,51 @@ def signal_handler(sig, frame):
         Terminal.inst().action('Type command :quit<ENTER> to exit !', view='status')
 
 
-def terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-              view_service, notifier_service):
-    if watcher_service:
-        watcher_service.terminate()
-    if trader_service:
-        trader_service.terminate()
-    if strategy_service:
-        strategy_service.terminate()
-    if monitor_service:
-        monitor_service.terminate()
-    if view_service:
-        view_service.terminate()
-    if notifier_service:
-        notifier_service.terminate()
+class Services(object):
+    """
+    Application services, passed at once to the termination.
+    """
 
+    __slots__ = 'watchdog', 'watcher', 'trader', 'strategy', 'monitor', 'view', 'notifier'
+
+    # termination order, the watchdog service is terminated last, after the database
+    TERMINATION_ORDER = ('watcher', 'trader', 'strategy', 'monitor', 'view', 'notifier')
+
+    def __init__(self, watchdog, watcher, trader, strategy, monitor, view, notifier):
+        self.watchdog = watchdog
+        self.watcher = watcher
+        self.trader = trader
+        self.strategy = strategy
+        self.monitor = monitor
+        self.view = view
+        self.notifier = notifier
+
+
+def terminate(services):
+    for name in Services.TERMINATION_ORDER:
+        service = getattr(services, name)
+        if service:
+            service.terminate()
+
+    from database.database import Database
     Database.terminate()
 
-    if watchdog_service:
-        watchdog_service.terminate()
+    if services.watchdog:
+        services.watchdog.terminate()
 
 
-def application(argv):
-    fix_thread_set_name()
+def add_listeners(services, listeners):
+    for producer, listener in listeners:
+        getattr(services, producer).add_listener(getattr(services, listener))
 
-    # init terminal display
-    Terminal.inst()
 
+def parse_command_line(argv):
+    """
+    Parse the process command line. Exit on --help, --version or on an invalid option.
+
+    @param argv list of str Process command line, first one is the program name.
+    @return dict Options with their defaults values.
+    """
     options = {
         'working-path': os.getcwd(),
         'identity': 'real',
@@ -90,162 +276,13 @@ def application(argv):
         'load': False          # load user data at startup from database
     }
 
-    # create initial siis data structure if necessary
-    install(options)
-
-    siis_log = SiisLog(options, Terminal.inst().style())
-    siis_logger = logging.getLogger('siis')
-    traceback_logger = logging.getLogger('siis.traceback')
-
-    # parse process command line
     if len(argv) > 1:
         options['livemode'] = True
 
         # utc or local datetime ?
         for arg in argv:
             if arg.startswith('--'):
-                if arg == '--paper-mode':
-                    # livemode but in paper-mode
-                    options['paper-mode'] = True            
-
-                elif arg == '--verbose':
-                    # verbose display for tools
-                    options['verbose'] = True
-
-                elif arg == '--load':
-                    # load trader and trade user data at startup
-                    options['load'] = True
-
-                elif arg == '--fetch':
-                    # use the fetcher
-                    options['tool'] = "fetcher"
-                elif arg == '--binarize':
-                    # use the binarizer
-                    options['tool'] = "binarizer"
-                elif arg == '--optimize':
-                    # use the optimizer
-                    options['tool'] = "optimizer"
-                elif arg == '--sync':
-                    # use the syncer
-                    options['tool'] = "syncer"
-                elif arg == '--rebuild':
-                    # use the rebuilder
-                    options['tool'] = "rebuilder"
-                elif arg == '--export':
-                    # use the exporter
-                    options['tool'] = "exporter"
-                elif arg == '--import':
-                    # use the importer
-                    options['tool'] = "importer"
-                elif arg == '--clean':
-                    # use the cleaner
-                    options['tool'] = "cleaner"
-                elif arg == '--statistics':
-                    # use the statistics tool
-                    options['tool'] = "statistics"
-                elif arg == '--history':
-                    # use the history tool
-                    options['tool'] = "history"
-                elif arg.startswith("--tool="):
-                    # use a named tool
-                    options['tool'] = arg.split('=')[1]
-
-                elif arg == '--no-conf':
-                    options['no-conf'] = True
-                elif arg == '--zip':
-                    options['zip'] = True
-                elif arg == '--update':
-                    options['update'] = True
-
-                elif arg == '--monitor':
-                    # use the importer
-                    options['monitor'] = True
-                elif arg.startswith('--monitor-port='):
-                    # override monitor HTTP port (+1 for WS port)
-                    options['monitor-port'] = int(arg.split('=')[1])
-
-                elif arg == '--install-market':
-                    # fetcher option
-                    options['install-market'] = True
-                elif arg == '--initial-fetch' or arg == '--prefetch':
-                    # do the initial OHLC fetch for watchers (syncer, watcher), default False
-                    options['initial-fetch'] = True
-                elif arg == '--store-trade':
-                    # store trade/quote/tick during watcher process (watcher), default False
-                    options['store-trade'] = True
-                elif arg == '--store-ohlc' or arg == '--store-candle':
-                    # store OHLCs during watcher process (watcher), default False
-                    options['store-ohlc'] = True
-
-                elif arg == '--backtest':
-                    # backtest mean always paper-mode
-                    options['paper-mode'] = True
-                    options['backtesting'] = True
-                elif arg.startswith('--timestep='):
-                    # backtesting timestep, default is 60 second
-                    options['timestep'] = float(arg.split('=')[1])
-                elif arg.startswith('--time-factor='):
-                    # backtesting time-factor
-                    options['time-factor'] = float(arg.split('=')[1])
-
-                elif arg == '--preprocess':
-                    # preprocess the indicators for the next backtest or live running
-                    options['preprocess'] = True
-
-                elif arg.startswith('--filename='):
-                    # used with import or export
-                    options['filename'] = arg.split('=')[1]
-
-                elif arg.startswith('--from='):
-                    # if backtest from date and tools
-                    options['from'] = parse_utc_datetime(arg.split('=')[1])
-                    if not options['from']:
-                        Terminal.inst().error("Invalid 'from' datetime format")
-                        sys.exit(-1)
-                elif arg.startswith('--to='):
-                    # if backtest to date and tools
-                    options['to'] = parse_utc_datetime(arg.split('=')[1])
-                    if not options['to']:
-                        Terminal.inst().error("Invalid 'to' datetime format")
-                        sys.exit(-1)
-                elif arg.startswith('--last='):
-                    # fetch the last n data history
-                    options['last'] = int(arg.split('=')[1])
-                    if options['last'] <= 0:
-                        Terminal.inst().error("Invalid 'last' value. Must be at least 1")
-                        sys.exit(-1)
-
-                elif arg.startswith('--market='):
-                    # fetch, binarize, optimize the data history for this market
-                    options['market'] = arg.split('=')[1]
-                elif arg.startswith('--spec='):
-                    # fetcher data history option
-                    options['option'] = arg.split('=')[1]
-                elif arg.startswith('--delay='):
-                    # fetcher data history fetching delay between two calls
-                    options['delay'] = float(arg.split('=')[1])
-                elif arg.startswith('--broker='):
-                    # broker name for fetcher, watcher, optimize, binarize
-                    options['broker'] = arg.split('=')[1]
-                elif arg.startswith('--timeframe='):
-                    # fetch, binarize, optimize base timeframe
-                    options['timeframe'] = arg.split('=')[1]
-                elif arg.startswith('--cascaded='):
-                    # fetch cascaded ohlc generation
-                    options['cascaded'] = arg.split('=')[1]
-                elif arg.startswith('--target='):
-                    # target ohlc generation
-                    options['target'] = arg.split('=')[1]
-
-                elif arg == '--watcher-only':
-                    # feed only with live data, does not run the trader and strategy services
-                    options['watcher-only'] = True              
-
-                elif arg.startswith('--profile='):
-                    # profile name
-                    options['profile'] = arg.split('=')[1]
-
-                elif arg == '--version':
+                if arg == '--version':
                     Terminal.inst().info('%s %s release %s' % (
                         APP_SHORT_NAME, '.'.join([str(x) for x in APP_VERSION]), APP_RELEASE))
                     sys.exit(0)
@@ -253,6 +290,22 @@ def application(argv):
                 elif arg == '--help' or arg == '-h':
                     display_cli_help()
                     sys.exit(0)
+
+                flag = FLAG_SETTERS.get(arg)
+                if flag:
+                    options.update(flag)
+
+                else:
+                    name, sep, value = arg.partition('=')
+                    setter = PREFIX_SETTERS.get(name) if sep else None
+
+                    if setter:
+                        key, conversion, error = setter
+                        options[key] = conversion(value)
+
+                        if error and not options[key]:
+                            Terminal.inst().error(error)
+                            sys.exit(-1)
             else:
                 options['identity'] = argv[1]
 
@@ -263,133 +316,79 @@ def application(argv):
                 Terminal.inst().error("Backtesting need from= and to= date time")
                 sys.exit(-1)
 
-    #
-    # tool mode
-    #
-
-    # @todo merge as Tool model
-    if options.get('tool') == "binarizer":
-        if options.get('market') and options.get('from') and options.get('to') and options.get('broker'):
-            from tools.binarizer import do_binarizer
-            do_binarizer(options)
-        else:
-            sys.exit(-1)
-
-        sys.exit(0)
-
-    # @todo merge as Tool model
-    if options.get('tool') == "fetcher":
-        if options.get('market') and options.get('broker'):
-            from tools.fetcher import do_fetcher
-            do_fetcher(options)
-        else:
-            sys.exit(-1)
-
-        sys.exit(0)
-
-    # @todo merge as Tool model
-    if options.get('tool') == "optimizer":
-        if options.get('market') and options.get('from') and options.get('broker'):
-            from tools.optimizer import do_optimizer
-            do_optimizer(options)
-        else:
-            sys.exit(-1)
-
-        sys.exit(0)
-
-    # @todo merge as Tool model
-    if options.get('tool') == "rebuilder":
-        if options.get('market') and options.get('from') and options.get('broker') and options.get('timeframe'):
-            from tools.rebuilder import do_rebuilder
-            do_rebuilder(options)
-        else:
-            sys.exit(-1)
+    return options
 
-        sys.exit(0)
 
+def run_tool(options):
+    """
+    Run the tool given by the options, then exit the process.
+    """
     # @todo merge as Tool model
-    if options.get('tool') == "exporter":
-        if options.get('market') and options.get('from') and options.get('broker') and options.get('filename'):
-            from tools.exporter import do_exporter
-            do_exporter(options)
+    required_options = LEGACY_TOOLS.get(options.get('tool'))
+    if required_options is not None:
+        if all(options.get(option) for option in required_options):
+            tool_name = options['tool']
+            do_tool = getattr(import_module("tools.%s" % tool_name), "do_%s" % tool_name)
+            do_tool(options)
         else:
             sys.exit(-1)
 
         sys.exit(0)
 
-    # @todo merge as Tool model
-    if options.get('tool') == "importer":
-        if options.get('filename'):
-            from tools.importer import do_importer
-            do_importer(options)
-        else:
-            sys.exit(-1)
+    from tools.tool import Tool
 
-        sys.exit(0)
-
-    if options.get('tool'):
-        ToolClazz = Tool.load_tool(options.get('tool'))
-        if ToolClazz:
-            if ToolClazz.need_identity():
-                if options['identity'].startswith('-'):
-                    Terminal.inst().error("First option must be the identity name")
-                    Terminal.inst().flush()
+    ToolClazz = Tool.load_tool(options.get('tool'))
+    if ToolClazz:
+        need_identity = ToolClazz.need_identity()
 
-                    sys.exit(-1)
+        if need_identity:
+            if options['identity'].startswith('-'):
+                Terminal.inst().error("First option must be the identity name")
+                Terminal.inst().flush()
 
-            tool = ToolClazz(options)
-
-            if not tool.check_options(options):
                 sys.exit(-1)
 
-            if ToolClazz.need_identity():
-                Terminal.inst().info("Starting SIIS %s using %s identity..." % (
-                    options.get('tool'), options['identity']))
-            else:
-                Terminal.inst().info("Starting SIIS %s..." % options.get('tool'))
-
-            Terminal.inst().flush()
-
-            tool.execute(options)
+        tool = ToolClazz(options)
 
-            Terminal.inst().info("%s done!" % (ToolClazz.alias() or options.get('tool')).capitalize())
-            Terminal.inst().flush()
-
-            Terminal.terminate()
+        if not tool.check_options(options):
+            sys.exit(-1)
 
-            sys.exit(0)
+        if need_identity:
+            Terminal.inst().info("Starting SIIS %s using %s identity..." % (
+                options.get('tool'), options['identity']))
         else:
-            sys.exit(-1)
+            Terminal.inst().info("Starting SIIS %s..." % options.get('tool'))
 
-    #
-    # normal mode
-    #
+        Terminal.inst().flush()
 
-    if options['identity'].startswith('-'):
-        Terminal.inst().error("First option must be the identity name")
+        tool.execute(options)
 
-    Terminal.inst().info("Starting SIIS using %s identity..." % options['identity'])
-    Terminal.inst().action("- type ':quit<Enter>' to terminate")
-    Terminal.inst().action("- type ':h<Enter> or :help<Enter>' to display help")
-    Terminal.inst().flush()
+        Terminal.inst().info("%s done!" % (ToolClazz.alias() or options.get('tool')).capitalize())
+        Terminal.inst().flush()
 
-    if options.get('backtesting'):  
-        Terminal.inst().notice("Process a backtesting.")
-    else:
-        Terminal.inst().notice("Process on real time.")
+        Terminal.terminate()
 
-    if options.get('paper-mode'):
-        Terminal.inst().notice("- Using paper-mode trader.")
+        sys.exit(0)
     else:
-        Terminal.inst().notice("- Using live-mode trader.")
+        sys.exit(-1)
 
-    signal.signal(signal.SIGINT, signal_handler)
 
-    #
-    # application
-    #
+def setup_services(options):
+    """
+    Instantiate and start the application services, and add their listeners. Exit the process on failure.
+
+    @return Services
+    """
+    # application services, imported only now to let the tools and the help start fast
+    from common.watchdog import WatchdogService
+    from monitor.service import MonitorService
+    from view.service import ViewService
+    from notifier.service import NotifierService
+    from watcher.service import WatcherService
+    from trader.service import TraderService
+    from strategy.service import StrategyService
 
-    # application services
+    from database.database import Database
 
     watchdog_service = WatchdogService(options)  
     monitor_service = MonitorService(options)
@@ -399,14 +398,16 @@ def application(argv):
     trader_service = TraderService(watcher_service, monitor_service, options)
     strategy_service = StrategyService(watcher_service, trader_service, monitor_service, options)
 
+    services = Services(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
+                        view_service, notifier_service)
+
     # watchdog service
     Terminal.inst().info("Starting watchdog service...")
     try:
         watchdog_service.start(options)
     except Exception as e:
         Terminal.inst().error(str(e))
-        terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                  view_service, notifier_service)
+        terminate(services)
         sys.exit(-1)
 
     # monitoring service
@@ -418,8 +419,7 @@ def application(argv):
             watchdog_service.add_service(monitor_service)
         except Exception as e:
             Terminal.inst().error(str(e))
-            terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                      view_service, notifier_service)
+            terminate(services)
             sys.exit(-1)
 
     # notifier service
@@ -427,8 +427,7 @@ def application(argv):
         notifier_service.start(options)
     except Exception as e:
         Terminal.inst().error(str(e))
-        terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                  view_service, notifier_service)
+        terminate(services)
         sys.exit(-1)
 
     # view service
@@ -436,8 +435,7 @@ def application(argv):
     #     watchdog_service.add_service(view_service)
     # except Exception as e:
     #     Terminal.inst().error(str(e))
-    #     terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-    #               view_service, notifier_service)
+    #     terminate(services)
     #     sys.exit(-1)
 
     # database manager
@@ -446,8 +444,7 @@ def application(argv):
         Database.inst().setup(options)
     except Exception as e:
         Terminal.inst().error(str(e))
-        terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                  view_service, notifier_service)
+        terminate(services)
         sys.exit(-1)
 
     # watcher service
@@ -457,8 +454,7 @@ def application(argv):
         watchdog_service.add_service(watcher_service)
     except Exception as e:
         Terminal.inst().error(str(e))
-        terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                  view_service, notifier_service)
+        terminate(services)
         sys.exit(-1)
 
     # trader service
@@ -468,18 +464,10 @@ def application(argv):
         watchdog_service.add_service(trader_service)
     except Exception as e:
         Terminal.inst().error(str(e))
-        terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                  view_service, notifier_service)
+        terminate(services)
         sys.exit(-1)
 
-    # want to display desktop notification and update views
-    watcher_service.add_listener(view_service)
-
-    # want to display desktop notification and update views
-    trader_service.add_listener(view_service)
-
-    # trader service listen to watcher service and update views
-    watcher_service.add_listener(trader_service)
+    add_listeners(services, LISTENERS_ON_TRADER_START)
 
     # strategy service
     Terminal.inst().message("Starting strategy service...")
@@ -488,28 +476,35 @@ def application(argv):
         watchdog_service.add_service(strategy_service)
     except Exception as e:
         Terminal.inst().error(str(e))
-        terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                  view_service, notifier_service)
+        terminate(services)
         sys.exit(-1)
 
-    # want to be notifier of system errors
-    watchdog_service.add_listener(notifier_service)
-
-    # strategy service listen to watcher service
-    watcher_service.add_listener(strategy_service)
-
-    # want to display watchdog notification, strategy service listen to trader service
-    trader_service.add_listener(notifier_service)
-    trader_service.add_listener(strategy_service)
-
-    # want to display desktop notification, update view and notify on discord
-    strategy_service.add_listener(notifier_service)
-    strategy_service.add_listener(view_service)
+    add_listeners(services, LISTENERS_ON_STRATEGY_START)
 
     # want signal and important notifications
     notifier_service.set_strategy_service(strategy_service)
     notifier_service.set_trader_service(trader_service)
 
+    return services
+
+
+def register_commands(services, options):
+    """
+    Create the commands handler and register the terminal commands.
+
+    @return CommandsHandler
+    """
+    from terminal.command import CommandsHandler
+
+    from app.generalcommands import register_general_commands
+    from app.tradingcommands import register_trading_commands
+    from app.regioncommands import register_region_commands
+    from app.alertcommands import register_alert_commands
+
+    watcher_service = services.watcher
+    trader_service = services.trader
+    strategy_service = services.strategy
+
     # register terminal commands
     commands_handler = CommandsHandler()
     commands_handler.init(options)
@@ -517,7 +512,7 @@ def application(argv):
     # cli commands registration
     register_general_commands(commands_handler)
     register_trading_commands(commands_handler, watcher_service, trader_service, strategy_service,
-                              monitor_service, notifier_service)
+                              services.monitor, services.notifier)
     register_region_commands(commands_handler, strategy_service)
     register_alert_commands(commands_handler, strategy_service)
 
@@ -528,30 +523,35 @@ def application(argv):
     #     watchdog_service.add_service(monitor_service)
     # except Exception as e:
     #     Terminal.inst().error(str(e))
-    #     terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-    #               view_service, notifier_service)
+    #     terminate(services)
     #     sys.exit(-1)
 
-    Terminal.inst().message("Running main loop...")
+    return commands_handler
 
-    Terminal.inst().upgrade()
-    Terminal.inst().message("Steady...", view='notice')
 
-    if view_service:
-        # setup the default views
-        try:
-            setup_default_views(view_service, watcher_service, trader_service, strategy_service)
-        except Exception as e:
-            Terminal.inst().error(str(e))
-            terminate(watchdog_service, watcher_service, trader_service, strategy_service, monitor_service,
-                      view_service, notifier_service)
-            sys.exit(-1)
+def run_loop(services, commands_handler):
+    """
+    Main loop, processing the terminal inputs and synchronizing the services, until the :quit command.
+    """
+    from notifier.notifier import Notifier
 
-    display_welcome()
+    siis_logger = logging.getLogger('siis')
+    traceback_logger = logging.getLogger('siis.traceback')
+
+    watchdog_service = services.watchdog
+    watcher_service = services.watcher
+    trader_service = services.trader
+    strategy_service = services.strategy
+    monitor_service = services.monitor
+    view_service = services.view
+    notifier_service = services.notifier
 
     LOOP_SLEEP = 0.016  # in second
     MAX_CMD_ALIVE = 5   # in second
 
+    # the terminal instance remains the same until the end of the main loop
+    term = Terminal.inst()
+
     running = True
 
     value = None
@@ -559,25 +559,31 @@ def application(argv):
     command_timeout = 0
     prev_timestamp = 0
 
+    # arguments of the last split command value
+    args_value = None
+    value_args = []
+
     try:
         while running:
+            # a single timestamp per iteration, for the typing timeout, monotonic to ignore any clock adjustment
+            now = time.monotonic()
+
             # keyboard input commands
             try:
-                c = Terminal.inst().read()
-                key = Terminal.inst().key()
+                c = term.read()
+                key = term.key()
 
                 if c:
-                    # split the command line
-                    args = [arg for arg in (value[1:].split(' ') if value and value.startswith(':') else []) if arg]
-                    if value and value[-1] == ' ':
-                        args.append('')
+                    # split the command line, only once per command value
+                    if value != args_value:
+                        value_args, args_value = command_args(value), value
 
                     # update the current type command
-                    if Terminal.inst().mode == Terminal.MODE_COMMAND:
-                        commands_handler.process_char(c, args)
+                    if term.mode == Terminal.MODE_COMMAND:
+                        commands_handler.process_char(c, value_args)
 
                     # only in normal mode
-                    if Terminal.inst().mode == Terminal.MODE_DEFAULT:
+                    if term.mode == Terminal.MODE_DEFAULT:
                         view_service.on_char(c)
 
                 if key:
@@ -587,13 +593,12 @@ def application(argv):
                         value_changed = True
                         command_timeout = 0
 
-                    # split the command line
-                    args = [arg for arg in (value[1:].split(' ') if value and value.startswith(':') else []) if arg]
-                    if value and value[-1] == ' ':
-                        args.append('')
+                    # split the command line, only once per command value
+                    if value != args_value:
+                        value_args, args_value = command_args(value), value
 
                     # process on the arguments
-                    args = commands_handler.process_key(key, args, Terminal.inst().mode == Terminal.MODE_COMMAND)
+                    args = commands_handler.process_key(key, value_args, term.mode == Terminal.MODE_COMMAND)
 
                     if args:
                         # regen the updated command line
@@ -605,7 +610,7 @@ def application(argv):
 
                     if key == 'KEY_ESCAPE':
                         # was in command mode, now in default mode
-                        Terminal.inst().set_mode(Terminal.MODE_DEFAULT)
+                        term.set_mode(Terminal.MODE_DEFAULT)
 
                 # @todo move the rest to command_handler
                 if c:
@@ -614,13 +619,13 @@ def application(argv):
                             # backspace, erase last command char
                             value = value[:-1] if value else None
                             value_changed = True
-                            command_timeout = time.time()
+                            command_timeout = now
 
                         elif c != '\n':
                             # append to the advanced command value
                             value += c
                             value_changed = True
-                            command_timeout = time.time()
+                            command_timeout = now
 
                         elif c == '\n':
                             result = commands_handler.process_cli(value)
@@ -642,23 +647,23 @@ def application(argv):
                             value = None
 
                             # use default mode
-                            Terminal.inst().set_mode(Terminal.MODE_DEFAULT)
+                            term.set_mode(Terminal.MODE_DEFAULT)
 
                     elif c != '\n':
                         # initial command value
                         value = "" + c
                         value_changed = True
-                        command_timeout = time.time()
+                        command_timeout = now
 
                         if value and value[0] == ':':
                             # use command mode
-                            Terminal.inst().set_mode(Terminal.MODE_COMMAND)
+                            term.set_mode(Terminal.MODE_COMMAND)
 
                     if value and value[0] != ':':
                         # direct key
 
                         # use default mode
-                        Terminal.inst().set_mode(Terminal.MODE_DEFAULT)
+                        term.set_mode(Terminal.MODE_DEFAULT)
 
                         try:
                             result = commands_handler.process_accelerator(key)
@@ -670,40 +675,17 @@ def application(argv):
                                 result = True
 
                                 # display views @todo must be managed by view_service
-                                if value == 'A':
-                                    Terminal.inst().switch_view('account')
-                                elif value == 'B':
-                                    Terminal.inst().switch_view('activealert')
+                                view_id = VIEW_KEYS.get(value)
+                                toggle = VIEW_TOGGLE_KEYS.get(value)
+
+                                if view_id:
+                                    term.switch_view(view_id)
+                                elif toggle:
+                                    if view_service:
+                                        getattr(view_service, toggle)()
+
                                 elif value == 'C':
-                                    Terminal.inst().clear_content()
-                                elif value == 'D':
-                                    Terminal.inst().switch_view('debug')
-                                elif value == 'F':
-                                    Terminal.inst().switch_view('strategy')
-                                elif value == 'I':
-                                    Terminal.inst().switch_view('content')
-                                elif value == 'M':
-                                    Terminal.inst().switch_view('market')
-                                elif value == 'N':
-                                    Terminal.inst().switch_view('signal')
-                                elif value == 'O':
-                                    Terminal.inst().switch_view('order')
-                                elif value == 'P':
-                                    Terminal.inst().switch_view('perf')
-                                elif value == 'Q':
-                                    Terminal.inst().switch_view('asset')
-                                elif value == 'R':
-                                    Terminal.inst().switch_view('region')
-                                elif value == 'S':
-                                    Terminal.inst().switch_view('stats')
-                                elif value == 'T':
-                                    Terminal.inst().switch_view('ticker')
-                                elif value == 'W':
-                                    Terminal.inst().switch_view('alert')
-                                elif value == 'X':
-                                    Terminal.inst().switch_view('position')
-                                elif value == 'Z':
-                                    Terminal.inst().switch_view('traderstate')
+                                    term.clear_content()
 
                                 elif value == '?':
                                     # ping services and workers
@@ -713,43 +695,16 @@ def application(argv):
                                     # toggle play/pause on backtesting
                                     if strategy_service.backtesting:
                                         results = strategy_service.toggle_play_pause()
-                                        Terminal.inst().notice("Backtesting now %s" % (
+                                        term.notice("Backtesting now %s" % (
                                             "play" if results else "paused"), view='status')
 
-                                elif value == 'a':
-                                    if notifier_service:
-                                        results = notifier_service.command(Notifier.COMMAND_TOGGLE, {
-                                            'notifier': "desktop", 'value': "audible"})
-                                        if results and not results.get('error'):
-                                            Terminal.inst().notice(results['messages'], view='status')
-                                elif value == 'n':
+                                elif value in NOTIFIER_TOGGLE_KEYS:
                                     if notifier_service:
-                                        results = notifier_service.command(Notifier.COMMAND_TOGGLE, {
-                                            'notifier': "desktop", 'value': "popup"})
+                                        results = notifier_service.command(Notifier.COMMAND_TOGGLE,
+                                                                           NOTIFIER_TOGGLE_KEYS[value])
                                         if results and not results.get('error'):
-                                            Terminal.inst().notice(results['messages'], view='status')
+                                            term.notice(results['messages'], view='status')
 
-                                elif value == '*':
-                                    if view_service:
-                                        view_service.toggle_opt1()
-                                elif value == '$':
-                                    if view_service:
-                                        view_service.toggle_opt2()
-                                elif value == '%':
-                                    if view_service:
-                                        view_service.toggle_percent()
-                                elif value == '=':
-                                    if view_service:
-                                        view_service.toggle_table()
-                                elif value == ',':
-                                    if view_service:
-                                        view_service.toggle_group()
-                                elif value == ';':
-                                    if view_service:
-                                        view_service.toggle_order()
-                                elif value == '!':
-                                    if view_service:
-                                        view_service.toggle_datetime_format()
                                 else:
                                     result = False
 
@@ -772,16 +727,16 @@ def application(argv):
                 # display advanced command only
                 if value_changed:
                     if value and value.startswith(':'):        
-                        Terminal.inst().message("Command: %s" % value[1:], view='command')
+                        term.message("Command: %s" % value[1:], view='command')
                     else:
-                        Terminal.inst().message("", view='command')
+                        term.message("", view='command')
 
                 # clear input if no char hit during the last MAX_CMD_ALIVE
                 if value and not value.startswith(':'):
-                    if (command_timeout > 0) and (time.time() - command_timeout >= MAX_CMD_ALIVE):
+                    if (command_timeout > 0) and (now - command_timeout >= MAX_CMD_ALIVE):
                         value = None
                         value_changed = True
-                        Terminal.inst().info("Current typing canceled", view='status')
+                        term.info("Current typing canceled", view='status')
 
                 # display strategy trading time (update max once per second)
                 if strategy_service.timestamp - prev_timestamp >= 1.0:
@@ -791,7 +746,7 @@ def application(argv):
                     elif trader_service.paper_mode:
                         mode = "paper-mode"
 
-                    Terminal.inst().message("%s - %s" % (mode, datetime.fromtimestamp(
+                    term.message("%s - %s" % (mode, datetime.fromtimestamp(
                         strategy_service.timestamp).strftime('%Y-%m-%d %H:%M:%S')), view='notice')
                     prev_timestamp = strategy_service.timestamp
 
@@ -809,31 +764,42 @@ def application(argv):
                 if notifier_service:
                     notifier_service.sync()
 
-                Terminal.inst().update()
-
-                # don't waste CPU time on main thread
-                time.sleep(LOOP_SLEEP)
+                term.update()
 
             except Exception as e:
                 siis_logger.error(repr(e))
                 traceback_logger.error(traceback.format_exc())           
 
+            # don't waste CPU time on main thread, even when the iteration failed
+            time.sleep(LOOP_SLEEP)
+
     finally:
         Terminal.inst().restore_term()
 
+
+def shutdown(services, commands_handler, options):
+    """
+    Terminate the commands handler, the services and the database, at the end of the main loop.
+    """
+    from monitor.service import MonitorService
+    from database.database import Database
+    from app.tradingcommands import ReconnectCommand
+
     Terminal.inst().info("Terminate...")
     Terminal.inst().flush() 
 
     commands_handler.terminate(options) if commands_handler else None
-    commands_handler = None
+
+    # no more forced reconnection once the watchers are terminating
+    ReconnectCommand.shutdown_executor()
 
     # service terminate
-    monitor_service.terminate() if monitor_service else None
-    strategy_service.terminate() if strategy_service else None
-    trader_service.terminate() if trader_service else None
-    watcher_service.terminate() if watcher_service else None
-    view_service.terminate() if view_service else None
-    notifier_service.terminate() if notifier_service else None
+    services.monitor.terminate() if services.monitor else None
+    services.strategy.terminate() if services.strategy else None
+    services.trader.terminate() if services.trader else None
+    services.watcher.terminate() if services.watcher else None
+    services.view.terminate() if services.view else None
+    services.notifier.terminate() if services.notifier else None
 
     MonitorService.stop_reactor()
 
@@ -843,7 +809,7 @@ def application(argv):
     Database.terminate()
     Terminal.inst().info("Database done !")
 
-    watchdog_service.terminate() if watchdog_service else None
+    services.watchdog.terminate() if services.watchdog else None
 
     Terminal.inst().info("Bye (could wait a little...) !")
     Terminal.inst().flush()
@@ -851,5 +817,80 @@ def application(argv):
     Terminal.terminate()
 
 
+def application(argv):
+    fix_thread_set_name()
+
+    # init terminal display
+    Terminal.inst()
+
+    # parse process command line, before doing any file system access
+    options = parse_command_line(argv)
+
+    # create initial siis data structure if necessary
+    install(options)
+
+    siis_log = SiisLog(options, Terminal.inst().style())
+
+    #
+    # tool mode
+    #
+
+    if options.get('tool'):
+        run_tool(options)
+
+    #
+    # normal mode
+    #
+
+    if options['identity'].startswith('-'):
+        Terminal.inst().error("First option must be the identity name")
+
+    Terminal.inst().info("Starting SIIS using %s identity..." % options['identity'])
+    Terminal.inst().action("- type ':quit<Enter>' to terminate")
+    Terminal.inst().action("- type ':h<Enter> or :help<Enter>' to display help")
+    Terminal.inst().flush()
+
+    if options.get('backtesting'):  
+        Terminal.inst().notice("Process a backtesting.")
+    else:
+        Terminal.inst().notice("Process on real time.")
+
+    if options.get('paper-mode'):
+        Terminal.inst().notice("- Using paper-mode trader.")
+    else:
+        Terminal.inst().notice("- Using live-mode trader.")
+
+    signal.signal(signal.SIGINT, signal_handler)
+
+    #
+    # application
+    #
+
+    services = setup_services(options)
+    commands_handler = register_commands(services, options)
+
+    Terminal.inst().message("Running main loop...")
+
+    Terminal.inst().upgrade()
+    Terminal.inst().message("Steady...", view='notice')
+
+    if services.view:
+        from view.defaultviews import setup_default_views
+
+        # setup the default views
+        try:
+            setup_default_views(services.view, services.watcher, services.trader, services.strategy)
+        except Exception as e:
+            Terminal.inst().error(str(e))
+            terminate(services)
+            sys.exit(-1)
+
+    display_welcome()
+
+    run_loop(services, commands_handler)
+
+    shutdown(services, commands_handler, options)
+
+
 if __name__ == "__main__":
     application(sys.argv)
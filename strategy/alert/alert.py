@@ -52,6 +52,7 @@ class Alert(object):
         self._expiry = 0.0           # expiration timestamp (<=0 never)
         self._countdown = -1         # max trigger occurrences, -1 mean forever (until expiry)
         self._timeframe = timeframe  # specific timeframe or 0 for any
+        self._dir = 0                # optional direction, -1 or 1, 0 for any
         self._message = ""           # optional user short message
 
     @classmethod
@@ -126,7 +127,7 @@ class Alert(object):
   
     @message.setter
     def message(self, message: str):
-        self.message = message
+        self._message = message
 
     #
     # processing
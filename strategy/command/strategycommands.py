@@ -0,0 +1,33 @@
+# @license Copyright (c) 2018 Dream Overflow
+# Strategy commands identifiers
+
+
+class StrategyCommands(object):
+    """
+    Strategy commands identifiers, inherited by Strategy.
+    Can be imported without the strategy and its dependencies, ie. by the terminal commands.
+    """
+
+    COMMAND_INFO = 1
+    COMMAND_TRADE_EXIT_ALL = 2  # close any trade for any market or only for a specific market-id
+    COMMAND_TRADE_CANCEL_ALL_PENDING = 3  # cancel any trade with empty realized quantity for any markets or specific
+    COMMAND_QUANTITY_GLOBAL_SHARE = 4     # global share quantity
+
+    COMMAND_TRADE_ENTRY = 10    # manually create a new trade
+    COMMAND_TRADE_MODIFY = 11   # modify an existing trade
+    COMMAND_TRADE_EXIT = 12     # exit (or eventually cancel if not again filled) an existing trade
+    COMMAND_TRADE_INFO = 13     # get and display manual trade info (such as listing operations)
+    COMMAND_TRADE_ASSIGN = 14   # manually assign a quantity to a new trade
+    COMMAND_TRADE_CLEAN = 15    # remove an existing trade without filling remaining quantity neither exiting
+    COMMAND_TRADE_CHECK = 16    # recheck a trade status
+
+    COMMAND_TRADER_MODIFY = 20
+    COMMAND_TRADER_INFO = 21
+    COMMAND_TRADER_STREAM = 22
+    COMMAND_TRADER_MODIFY_ALL = 23
+    COMMAND_TRADER_RESTART = 24
+    COMMAND_TRADER_RECHECK = 25
+    COMMAND_TRADER_RECHECK_ALL = 26
+    COMMAND_TRADER_EXPORT = 27
+    COMMAND_TRADER_EXPORT_ALL = 28
+    COMMAND_TRADER_IMPORT_ALL = 29
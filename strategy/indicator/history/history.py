@@ -38,7 +38,7 @@ class HistoryIndicator(Indicator):
         self._compute_at_close = True  # only at close
 
         self._length = length   # number of stored values
-        self._values = np.array([0.0]*length)
+        self._values = np.zeros(length)
 
     @property
     def length(self):
@@ -22,8 +22,7 @@ class IchimokuIndicator(Indicator):
     """
 
     __slots__ = '_tenkan_sen_l', '_kijun_sen_l', '_senkou_span_b_l', '_tenkans' ,'_kijuns', \
-                '_ssas', '_ssbs', '_chikous', '_prev_tenkan', '_last_tenkan', '_prev_kijun', '_last_kijun', \
-                '_trmax_h', '_trmin_l', '_krmax_h', '_krmin_l', '_sbrmax_h', '_sbrmin_l'
+                '_ssas', '_ssbs', '_chikous', '_prev_tenkan', '_last_tenkan', '_prev_kijun', '_last_kijun'
 
     @classmethod
     def indicator_type(cls):
@@ -54,15 +53,6 @@ class IchimokuIndicator(Indicator):
         self._prev_kijun = 0.0
         self._last_kijun = 0.0
 
-        self._trmax_h = np.empty(0)
-        self._trmin_l = np.empty(0)
-
-        self._krmax_h = np.empty(0)
-        self._krmin_l = np.empty(0)
-
-        self._sbrmax_h = np.empty(0)
-        self._sbrmin_l = np.empty(0)
-
     @property
     def tenkan_sen_l(self):
         return self._tenkan_sen_l
@@ -123,84 +113,45 @@ class IchimokuIndicator(Indicator):
     def last_kijun(self):
         return self._last_kijun
 
-    @staticmethod
-    def rolling_min(array, window, out):
-        # need at least window data
-        for i in range(0, window):
-            out[i] = 0.0
-
-        for i in range(window, len(array), 1):
-            out[i] = np.amin(array[i-window:i])
-
-    @staticmethod
-    def rolling_max(array, window, out):
-        # need at least window data
-        for i in range(0, window):
-            out[i] = 0.0
-
-        for i in range(window, len(array), 1):
-            out[i] = np.amax(array[i-window:i])
-
     def compute(self, timestamp, high, low, close):
         self._prev_tenkan = self._last_tenkan
         self._prev_kijun = self._last_kijun
 
-        n = len(high)
-
-        # # resize temporary arrays
-        # if len(self._trmax_h) != n:
-        #     self._trmax_h = np.zeros(n)
-        #     self._trmin_l = np.zeros(n)
-
-        #     self._krmax_h = np.zeros(n)
-        #     self._krmin_l = np.zeros(n)
-
-        #     self._sbrmax_h = np.zeros(n)
-        #     self._sbrmin_l = np.zeros(n)
+        # each line is the middle price of the highest high and the lowest low of its window, computed by TA-Lib
 
         #
         # tenkan-sen - conversion line (window of 9)
         #
 
-        # IchimokuIndicator.rolling_max(high, self._tenkan_sen_l, self._trmax_h)
-        # IchimokuIndicator.rolling_min(low, self._tenkan_sen_l, self._trmin_l)
-
-        # self._tenkans = (self._trmax_h + self._trmin_l) * 0.5
         self._tenkans = ta_MIDPRICE(high, low, self._tenkan_sen_l)
 
         #
         # kijun-sen - base line (window of 9)
         #
 
-        # IchimokuIndicator.rolling_max(high, self._kijun_sen_l, self._krmax_h)
-        # IchimokuIndicator.rolling_min(low, self._kijun_sen_l, self._krmin_l)
-
-        # self._kijuns = (self._krmax_h + self._krmin_l) * 0.5
         self._kijuns = ta_MIDPRICE(high, low, self._kijun_sen_l)
 
         #
         # senkou span A - leading span A
         #
 
-        # must be considered as shifted in future (26)
-        self._ssas = (self._tenkans + self._kijuns) * 0.5
+        # must be considered as shifted in future (26), halved in place of the new sum array
+        self._ssas = np.add(self._tenkans, self._kijuns)
+        self._ssas *= 0.5
 
         #
         # senkou span B - leading span B
         #
 
-        # IchimokuIndicator.rolling_max(high, self._senkou_span_b_l, self._sbrmax_h)
-        # IchimokuIndicator.rolling_min(low, self._senkou_span_b_l, self._sbrmin_l)
-
-        # # must be considered as shifted in future (26)
-        # self._ssbs = (self._sbrmax_h + self._sbrmin_l) * 0.5
+        # must be considered as shifted in future (26)
         self._ssbs = ta_MIDPRICE(high, low, self._senkou_span_b_l)
 
         #
         # chikou span - lagging span (shifted in past)
         #
 
-        # self._chikous = np.array(close)
+        # the close prices themselves, not copied when already an array (must not be modified)
+        self._chikous = np.asarray(close)
 
         self._last_tenkan = self._tenkans[-1]
         self._last_kijun = self._kijuns[-1]
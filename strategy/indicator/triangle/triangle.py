@@ -99,8 +99,8 @@ class TriangleIndicator(Indicator):
         return self._split_idx, self._bottom_partial_interp, self._top_partial_interp
 
     def triangles(self):
-        self._bottom = np.array([0.0]*2*len(self._bottom_partial_interp))
-        self._top = np.array([0.0]*2*len(self._top_partial_interp))
+        self._bottom = np.zeros(2*len(self._bottom_partial_interp))
+        self._top = np.zeros(2*len(self._top_partial_interp))
 
         j = 0
         for i in range(0, len(self._bottom_partial_interp)):
@@ -39,6 +39,7 @@ from database.database import Database
 
 from .process import alphaprocess
 
+from .command.strategycommands import StrategyCommands
 from .command.strategycmdexitalltrade import cmd_strategy_exit_all_trade
 from .command.strategycmdmodifyall import cmd_strategy_trader_modify_all
 from .command.strategycmdcancelallpendingtrade import cmd_strategy_cancel_all_pending_trade
@@ -72,7 +73,7 @@ error_logger = logging.getLogger('siis.error.strategy')
 traceback_logger = logging.getLogger('siis.traceback.strategy')
 
 
-class Strategy(Runnable):
+class Strategy(Runnable, StrategyCommands):
     """
     Strategy base model and implementation.
 
@@ -86,29 +87,7 @@ class Strategy(Runnable):
     MAX_SIGNALS = 2000   # max size of the signals messages queue before ignore some market data (tick, ohlc)
     MAX_SIGNALS_DELAY = 5.0     # alert only when max signal is reach for a period of 5 seconds
 
-    COMMAND_INFO = 1
-    COMMAND_TRADE_EXIT_ALL = 2  # close any trade for any market or only for a specific market-id
-    COMMAND_TRADE_CANCEL_ALL_PENDING = 3  # cancel any trade with empty realized quantity for any markets or specific
-    COMMAND_QUANTITY_GLOBAL_SHARE = 4     # global share quantity
-
-    COMMAND_TRADE_ENTRY = 10    # manually create a new trade
-    COMMAND_TRADE_MODIFY = 11   # modify an existing trade
-    COMMAND_TRADE_EXIT = 12     # exit (or eventually cancel if not again filled) an existing trade
-    COMMAND_TRADE_INFO = 13     # get and display manual trade info (such as listing operations)
-    COMMAND_TRADE_ASSIGN = 14   # manually assign a quantity to a new trade
-    COMMAND_TRADE_CLEAN = 15    # remove an existing trade without filling remaining quantity neither exiting
-    COMMAND_TRADE_CHECK = 16    # recheck a trade status
-
-    COMMAND_TRADER_MODIFY = 20
-    COMMAND_TRADER_INFO = 21
-    COMMAND_TRADER_STREAM = 22
-    COMMAND_TRADER_MODIFY_ALL = 23
-    COMMAND_TRADER_RESTART = 24
-    COMMAND_TRADER_RECHECK = 25
-    COMMAND_TRADER_RECHECK_ALL = 26
-    COMMAND_TRADER_EXPORT = 27
-    COMMAND_TRADER_EXPORT_ALL = 28
-    COMMAND_TRADER_IMPORT_ALL = 29
+    # COMMAND_* constants are inherited from StrategyCommands
 
     _name: str
     _strategy_service: StrategyService
@@ -703,6 +682,7 @@ class Strategy(Runnable):
     def symbols_ids(self) -> List[str]:
         """
         Returns the complete list containing market-ids, theirs alias and theirs related symbol name.
+        The list is sorted, and a new list is returned at each call.
         """
         with self._mutex:
             names = []
@@ -722,6 +702,22 @@ class Strategy(Runnable):
 
         return names
 
+    def has_symbol(self, symbol_or_market_id: str) -> bool:
+        """
+        Returns True if the value is one of the symbols_ids, a market-id, a symbol or an alias of an instrument,
+        without building the list.
+        """
+        with self._mutex:
+            if symbol_or_market_id in self._instruments:
+                return True
+
+            for k, instrument in self._instruments.items():
+                if (symbol_or_market_id == instrument.market_id or symbol_or_market_id == instrument.symbol or
+                        symbol_or_market_id == instrument.alias):
+                    return True
+
+        return False
+
     def instruments_ids(self) -> List[str]:
         """
         Returns the complete list containing market-ids (instruments only).
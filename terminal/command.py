@@ -4,6 +4,9 @@
 # terminal commands
 
 import json
+import time
+
+from bisect import bisect_left
 
 from app.appexception import CommandHandlerException, CommandException
 from terminal.terminal import Terminal
@@ -15,9 +18,13 @@ error_logger = logging.getLogger('siis.error.command')
 
 class Command(object):
 
+    __slots__ = '_name', '_alias', '_accelerator', '_is_user', '_completion_cache'
+
     SUMMARY = ""
     HELP = tuple()
 
+    COMPLETION_CACHE_TTL = 0.5  # in seconds, delay before reloading the values of a completion
+
     def __init__(self, command_name, command_alias=None, accelerator=None, is_user=False):
         """
         @param command_name Advanced command identifier (must be unique)
@@ -33,6 +40,8 @@ class Command(object):
         self._accelerator = accelerator
         self._is_user = is_user
 
+        self._completion_cache = {}
+
     @classmethod
     def summary(cls):
         return cls.SUMMARY
@@ -79,20 +88,49 @@ class Command(object):
         """
         return args, tab_pos
 
-    def iterate(self, index, values, args, tab_pos, direction):
+    def cached_values(self, key, loader, owner=None):
+        """
+        Returns the values of a completion list, reloaded using the loader only if they are older than
+        COMPLETION_CACHE_TTL, that way repeated tabs does not rebuild the same list at each key press.
+
+        @param key str Identifier of the list of values
+        @param loader callable Returns the list of values
+        @param owner object Optional instance the values comes from, the cache is invalidated if it changes
+        """
+        now = time.monotonic()
+        cached = self._completion_cache.get(key)
+
+        if cached is not None and cached[1] is owner and now - cached[0] < self.COMPLETION_CACHE_TTL:
+            return cached[2]
+
+        values = loader()
+        self._completion_cache[key] = (now, owner, values)
+
+        return values
+
+    def iterate(self, index, values, args, tab_pos, direction, ordered=False):
         """
         Iterate the possibles values of a list for an argument index.
+
+        @param ordered True if the values are sorted, then the range of the values starting with the word is found
+            by bisection instead of testing each value
         """
         if not values:
             return args, 0
 
-        if len(args) > index:
-            filtered = []
-            for v in values:
-                if v.startswith(args[index]):
-                    filtered.append(v)
+        if len(args) > index and args[index]:
+            # an empty word matches any value, no need to build a filtered copy
+            word = args[index]
 
-            values = filtered
+            if ordered:
+                values = values[bisect_left(values, word):bisect_left(values, word + '\U0010ffff')]
+            else:
+                filtered = []
+                for v in values:
+                    if v.startswith(word):
+                        filtered.append(v)
+
+                values = filtered
 
             if not values:
                 return args, 0
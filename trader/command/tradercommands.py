@@ -0,0 +1,24 @@
+# @license Copyright (c) 2018 Dream Overflow
+# Trader commands identifiers
+
+
+class TraderCommands(object):
+    """
+    Trader commands identifiers, inherited by Trader.
+    Can be imported without the trader and its dependencies, ie. by the terminal commands.
+    """
+
+    # general command
+    COMMAND_INFO = 1
+    COMMAND_TRADER_FROZE_ASSET_QUANTITY = 2   # froze a free quantity of an asset that could not be used
+    COMMAND_TICKER_MEMSET = 3                 # memorize the last market price for any or a specific ticker
+    COMMAND_EXPORT = 4                        # export trader state (supported for paper-trader only)
+    COMMAND_IMPORT = 5                        # import previous trader state (supported for paper-trader only)
+    COMMAND_STREAM = 6                        # subscribe/unsubscribe to trade/tick/ohlc/depth/market-update streaming
+
+    # order commands
+    COMMAND_CLOSE_MARKET = 110                # close a managed or unmanaged position at market now
+    COMMAND_CLOSE_ALL_MARKET = 111            # close any positions of this account at market now
+    COMMAND_CANCEL_ALL_ORDER = 112            # cancel any pending orders
+    COMMAND_SELL_ALL_ASSET = 113              # sell any quantity of asset at market price
+    COMMAND_CANCEL_ORDER = 114                # cancel a specific order
@@ -22,6 +22,7 @@ import collections
 
 from datetime import datetime
 
+from .command.tradercommands import TraderCommands
 from .command.tradercmdstream import cmd_trader_stream
 from .command.tradercmdinfo import cmd_trader_info
 from .command.tradercmdfrozeassetquantity import cmd_trader_froze_asset_quantity
@@ -49,7 +50,7 @@ error_logger = logging.getLogger('siis.error.trader')
 traceback_logger = logging.getLogger('siis.traceback.trader')
 
 
-class Trader(Runnable):
+class Trader(Runnable, TraderCommands):
     """
     Trader base class to specialize per broker.
     """
@@ -59,20 +60,7 @@ class Trader(Runnable):
     PURGE_COMMANDS_DELAY = 180                # 180s keep commands in seconds
     MAX_COMMANDS_QUEUE = 100
 
-    # general command
-    COMMAND_INFO = 1
-    COMMAND_TRADER_FROZE_ASSET_QUANTITY = 2   # froze a free quantity of an asset that could not be used
-    COMMAND_TICKER_MEMSET = 3                 # memorize the last market price for any or a specific ticker
-    COMMAND_EXPORT = 4                        # export trader state (supported for paper-trader only)
-    COMMAND_IMPORT = 5                        # import previous trader state (supported for paper-trader only)
-    COMMAND_STREAM = 6                        # subscribe/unsubscribe to trade/tick/ohlc/depth/market-update streaming
-
-    # order commands
-    COMMAND_CLOSE_MARKET = 110                # close a managed or unmanaged position at market now
-    COMMAND_CLOSE_ALL_MARKET = 111            # close any positions of this account at market now
-    COMMAND_CANCEL_ALL_ORDER = 112            # cancel any pending orders
-    COMMAND_SELL_ALL_ASSET = 113              # sell any quantity of asset at market price
-    COMMAND_CANCEL_ORDER = 114                # cancel a specific order
+    # COMMAND_* constants are inherited from TraderCommands
 
     _orders: Dict[str, Order]
     _positions: Dict[str, Position]
@@ -176,6 +164,7 @@ class Trader(Runnable):
     def symbols_ids(self) -> List[str]:
         """
         Returns the complete list containing market-ids, their alias and their related symbol name.
+        The list is sorted, and a new list is returned at each call.
         """
         names = []
 
@@ -212,6 +201,21 @@ class Trader(Runnable):
         with self._mutex:
             return market_id in self._markets
 
+    def has_symbol(self, symbol_or_market_id: str) -> bool:
+        """
+        Returns True if the value is one of the symbols_ids, a market-id or a market symbol,
+        without building the list.
+        """
+        with self._mutex:
+            if symbol_or_market_id in self._markets:
+                return True
+
+            for k, market in self._markets.items():
+                if symbol_or_market_id == market.market_id or symbol_or_market_id == market.symbol:
+                    return True
+
+        return False
+
     #
     # processing
     #
@@ -106,9 +106,7 @@ class FTXFuturesFetcher(Fetcher):
         logger.info("Fetcher %s has retrieved on market %s %s aggregated trades" % (self.name, market_id, count))
 
     def fetch_candles(self, market_id, timeframe, from_date=None, to_date=None, n_last=None):
-        TF_LIST = [15, 60, 300, 900, 3600, 14400, 86400, 259200, 604800, 2592000]
-
-        if timeframe not in TF_LIST:
+        if timeframe not in Connector.TIMEFRAMES:
             logger.error("Fetcher %s does not support timeframe %s" % (self.name, timeframe))
             return
 
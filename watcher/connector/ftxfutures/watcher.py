@@ -1056,9 +1056,7 @@ class FTXFuturesWatcher(Watcher):
                    -1 if trade['side'] == "sell" else 1)
 
     def fetch_candles(self, market_id, timeframe, from_date=None, to_date=None, n_last=None):
-        TF_LIST = [15, 60, 300, 900, 3600, 14400, 86400, 259200, 604800, 2592000]
-
-        if timeframe not in TF_LIST:
+        if timeframe not in Connector.TIMEFRAMES:
             logger.error("Watcher %s does not support timeframe %s" % (self.name, timeframe))
             return
 